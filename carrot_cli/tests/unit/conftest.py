@@ -0,0 +1,34 @@
+import mockito
+import pytest
+from click.testing import CliRunner
+from carrot_cli.config import manager as config
+from tests.unit.mock_util import answer_for
+
+
+@pytest.fixture
+def no_email():
+    """
+    Makes the email config variable read as unset, so tests don't pick up the value from the local
+    config file. Modules opt in with pytestmark = pytest.mark.usefixtures("no_email"), and their
+    autouse unstub fixture removes the stub after each test
+    """
+    mockito.when(config).load_var_no_error("email").thenReturn(None)
+
+
+@pytest.fixture(scope="session")
+def runner():
+    """
+    A single CliRunner shared across the session, since invoke doesn't keep state between calls
+    """
+    return CliRunner()
+
+
+@pytest.fixture
+def rest_stub(request):
+    """
+    Stubs a rest module function from an indirect param of the form (module, method, args, return)
+    so that only a call with args returns a value, and returns that value
+    """
+    module, method, args, ret = request.param
+    getattr(mockito.when(module), method)(...).thenAnswer(answer_for(args, ret))
+    return ret
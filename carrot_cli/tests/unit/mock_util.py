@@ -0,0 +1,9 @@
+def answer_for(args, ret, **kwargs):
+    """
+    Returns a mockito answer that gives ret for a call with exactly args and kwargs and None for
+    any other call, so a single stub can stand in for a catch-all plus a specific stub
+    """
+    expected_args = tuple(args)
+    return lambda *call_args, **call_kwargs: (
+        ret if call_args == expected_args and call_kwargs == kwargs else None
+    )
@@ -6,6 +6,12 @@ import mockito
 import pytest
 from carrot_cli.__main__ import main_entry as carrot
 from carrot_cli.rest import software, software_versions
+from tests.unit.mock_util import answer_for
+
+SOFTWARE_VERSION_ID = "cd987859-06fe-4b1a-9e96-47d4f36bf819"
+MISSING_SOFTWARE_VERSION_ID = "986325ba-06fe-4b1a-9e96-47d4f36bf819"
+SOFTWARE_ID = "3d1bfbab-d9ec-46c7-aa8e-9c1d1808f2b8"
+COMMIT = "ca82a6dff817ec66f44342007202690a93763949"
 
 
 @pytest.fixture(autouse=True)
@@ -14,76 +20,95 @@ def unstub():
     mockito.unstub()
 
 
-@pytest.fixture(
-    params=[
-        {
-            "args": [
+@pytest.mark.parametrize(
+    "args,rest_stub",
+    [
+        (
+            [
                 "software",
                 "version",
                 "find_by_id",
-                "cd987859-06fe-4b1a-9e96-47d4f36bf819",
+                SOFTWARE_VERSION_ID,
             ],
-            "return": json.dumps(
-                {
-                    "created_at": "2020-09-16T18:48:06.371563",
-                    "commit": "ca82a6dff817ec66f44342007202690a93763949",
-                    "commit_date": "2020-09-10T18:48:06.371563",
-                    "software_id": "3d1bfbab-d9ec-46c7-aa8e-9c1d1808f2b8",
-                    "software_version_id": "cd987859-06fe-4b1a-9e96-47d4f36bf819",
-                    "tags": []
-                },
-                indent=4,
-                sort_keys=True,
+            (
+                software_versions,
+                "find_by_id",
+                [SOFTWARE_VERSION_ID],
+                json.dumps(
+                    {
+                        "created_at": "2020-09-16T18:48:06.371563",
+                        "commit": COMMIT,
+                        "commit_date": "2020-09-10T18:48:06.371563",
+                        "software_id": SOFTWARE_ID,
+                        "software_version_id": SOFTWARE_VERSION_ID,
+                        "tags": []
+                    },
+                    indent=4,
+                    sort_keys=True,
+                ),
             ),
-        },
-        {
-            "args": [
+        ),
+        (
+            [
                 "software",
                 "version",
                 "find_by_id",
-                "cd987859-06fe-4b1a-9e96-47d4f36bf819",
+                SOFTWARE_VERSION_ID,
             ],
-            "return": json.dumps(
-                {
-                    "title": "No software_version found",
-                    "status": 404,
-                    "detail": "No software_version found with the specified ID",
-                },
-                indent=4,
-                sort_keys=True,
+            (
+                software_versions,
+                "find_by_id",
+                [SOFTWARE_VERSION_ID],
+                json.dumps(
+                    {
+                        "title": "No software_version found",
+                        "status": 404,
+                        "detail": "No software_version found with the specified ID",
+                    },
+                    indent=4,
+                    sort_keys=True,
+                ),
             ),
-        },
-    ]
+        ),
+    ],
+    indirect=["rest_stub"],
 )
-def find_by_id_data(request):
-    # Set all requests to return None so only the one we expect will return a value
-    mockito.when(software_versions).find_by_id(...).thenReturn(None)
-    # Mock up request response
-    mockito.when(software_versions).find_by_id(request.param["args"][3]).thenReturn(
-        request.param["return"]
-    )
-    return request.param
+def test_find_by_id(args, rest_stub):
+    runner = CliRunner()
+    test_software_version = runner.invoke(carrot, args)
+    assert test_software_version.output == rest_stub + "\n"
 
 
-def test_find_by_id(find_by_id_data):
-    runner = CliRunner()
-    test_software_version = runner.invoke(carrot, find_by_id_data["args"])
-    assert test_software_version.output == find_by_id_data["return"] + "\n"
+def stub_find(find_data):
+    """Mocks up the find request for the find_data case"""
+    # If there's a value for from_name, set the return value for trying to retrieve the existing
+    # record
+    from_name = find_data.get("from_name")
+    if from_name:
+        mockito.when(software).find(
+            name=from_name["name"],
+            limit=2
+        ).thenReturn(from_name["return"])
+    # Mock up request response, with any other request returning None
+    mockito.when(software_versions).find(...).thenAnswer(
+        answer_for(find_data["params"], find_data["return"])
+    )
 
 
-@pytest.fixture(
-    params=[
+@pytest.mark.parametrize(
+    "find_data",
+    [
         {
-            "args": [
+            "args": (
                 "software",
                 "version",
                 "find",
                 "--software_version_id",
-                "cd987859-06fe-4b1a-9e96-47d4f36bf819",
+                SOFTWARE_VERSION_ID,
                 "--software_id",
-                "3d1bfbab-d9ec-46c7-aa8e-9c1d1808f2b8",
+                SOFTWARE_ID,
                 "--commit",
-                "ca82a6dff817ec66f44342007202690a93763949",
+                COMMIT,
                 "--created_before",
                 "2020-10-00T00:00:00.000000",
                 "--created_after",
@@ -98,11 +123,11 @@ def test_find_by_id(find_by_id_data):
                 1,
                 "--offset",
                 0,
-            ],
-            "params": [
-                "cd987859-06fe-4b1a-9e96-47d4f36bf819",
-                "3d1bfbab-d9ec-46c7-aa8e-9c1d1808f2b8",
-                "ca82a6dff817ec66f44342007202690a93763949",
+            ),
+            "params": (
+                SOFTWARE_VERSION_ID,
+                SOFTWARE_ID,
+                COMMIT,
                 "2020-10-00T00:00:00.000000",
                 "2020-09-00T00:00:00.000000",
                 "2020-11-00T00:00:00.000000",
@@ -110,15 +135,15 @@ def test_find_by_id(find_by_id_data):
                 "asc(commit)",
                 1,
                 0,
-            ],
+            ),
             "return": json.dumps(
                 [
                     {
                         "created_at": "2020-09-16T18:48:06.371563",
-                        "commit": "ca82a6dff817ec66f44342007202690a93763949",
+                        "commit": COMMIT,
                         "commit_date": "2020-09-10T18:48:06.371563",
-                        "software_id": "3d1bfbab-d9ec-46c7-aa8e-9c1d1808f2b8",
-                        "software_version_id": "cd987859-06fe-4b1a-9e96-47d4f36bf819",
+                        "software_id": SOFTWARE_ID,
+                        "software_version_id": SOFTWARE_VERSION_ID,
                         "tags": ["tag1"]
                     }
                 ],
@@ -127,16 +152,16 @@ def test_find_by_id(find_by_id_data):
             ),
         },
         {
-            "args": [
+            "args": (
                 "software",
                 "version",
                 "find",
                 "--software_version_id",
-                "cd987859-06fe-4b1a-9e96-47d4f36bf819",
+                SOFTWARE_VERSION_ID,
                 "--software",
                 "New Sword of Protection software",
                 "--commit",
-                "ca82a6dff817ec66f44342007202690a93763949",
+                COMMIT,
                 "--created_before",
                 "2020-10-00T00:00:00.000000",
                 "--created_after",
@@ -151,11 +176,11 @@ def test_find_by_id(find_by_id_data):
                 1,
                 "--offset",
                 0,
-            ],
-            "params": [
-                "cd987859-06fe-4b1a-9e96-47d4f36bf819",
-                "3d1bfbab-d9ec-46c7-aa8e-9c1d1808f2b8",
-                "ca82a6dff817ec66f44342007202690a93763949",
+            ),
+            "params": (
+                SOFTWARE_VERSION_ID,
+                SOFTWARE_ID,
+                COMMIT,
                 "2020-10-00T00:00:00.000000",
                 "2020-09-00T00:00:00.000000",
                 "2020-11-00T00:00:00.000000",
@@ -163,7 +188,7 @@ def test_find_by_id(find_by_id_data):
                 "asc(commit)",
                 1,
                 0,
-            ],
+            ),
             "from_name": {
                 "name": "New Sword of Protection software",
                 "return": json.dumps(
@@ -174,7 +199,7 @@ def test_find_by_id(find_by_id_data):
                             "repository_url": "example.com/repo.git",
                             "description": "This new software replaced the broken one",
                             "name": "New Sword of Protection software",
-                            "software_id": "3d1bfbab-d9ec-46c7-aa8e-9c1d1808f2b8",
+                            "software_id": SOFTWARE_ID,
                         }
                     ],
                     indent=4,
@@ -185,10 +210,10 @@ def test_find_by_id(find_by_id_data):
                 [
                     {
                         "created_at": "2020-09-16T18:48:06.371563",
-                        "commit": "ca82a6dff817ec66f44342007202690a93763949",
+                        "commit": COMMIT,
                         "commit_date": "2020-09-10T18:48:06.371563",
-                        "software_id": "3d1bfbab-d9ec-46c7-aa8e-9c1d1808f2b8",
-                        "software_version_id": "cd987859-06fe-4b1a-9e96-47d4f36bf819",
+                        "software_id": SOFTWARE_ID,
+                        "software_version_id": SOFTWARE_VERSION_ID,
                         "tags": ["hi"]
                     }
                 ],
@@ -197,15 +222,15 @@ def test_find_by_id(find_by_id_data):
             ),
         },
         {
-            "args": [
+            "args": (
                 "software",
                 "version",
                 "find",
                 "--software_version_id",
-                "986325ba-06fe-4b1a-9e96-47d4f36bf819",
-            ],
-            "params": [
-                "986325ba-06fe-4b1a-9e96-47d4f36bf819",
+                MISSING_SOFTWARE_VERSION_ID,
+            ),
+            "params": (
+                MISSING_SOFTWARE_VERSION_ID,
                 None,
                 None,
                 None,
@@ -215,7 +240,7 @@ def test_find_by_id(find_by_id_data):
                 None,
                 20,
                 0,
-            ],
+            ),
             "return": json.dumps(
                 {
                     "title": "No software_versions found",
@@ -226,91 +251,70 @@ def test_find_by_id(find_by_id_data):
                 sort_keys=True,
             ),
         },
-    ]
+    ],
+    ids=["full_query", "from_name", "not_found"],
 )
-def find_data(request):
-    # Set all requests to return None so only the one we expect will return a value
-    mockito.when(software_versions).find(...).thenReturn(None)
-    # If there's a value for from_name, set the return value for trying to retrieve the existing
-    # record
-    if "from_name" in request.param:
-        mockito.when(software).find(
-            name=request.param["from_name"]["name"],
-            limit=2
-        ).thenReturn(request.param["from_name"]["return"])
-    # Mock up request response
-    mockito.when(software_versions).find(
-        request.param["params"][0],
-        request.param["params"][1],
-        request.param["params"][2],
-        request.param["params"][3],
-        request.param["params"][4],
-        request.param["params"][5],
-        request.param["params"][6],
-        request.param["params"][7],
-        request.param["params"][8],
-        request.param["params"][9],
-    ).thenReturn(request.param["return"])
-    return request.param
-
-
 def test_find(find_data):
+    stub_find(find_data)
     runner = CliRunner()
     test_software_version = runner.invoke(carrot, find_data["args"])
     assert test_software_version.output == find_data["return"] + "\n"
 
-@pytest.fixture(
-    params=[
-        {
-            "args": [
+
+@pytest.mark.parametrize(
+    "args,rest_stub",
+    [
+        (
+            [
                 "software",
                 "version",
                 "update",
-                "cd987859-06fe-4b1a-9e96-47d4f36bf819",
+                SOFTWARE_VERSION_ID,
             ],
-            "return": json.dumps(
-                {
-                    "created_at": "2020-09-16T18:48:06.371563",
-                    "commit": "ca82a6dff817ec66f44342007202690a93763949",
-                    "commit_date": "2020-09-10T18:48:06.371563",
-                    "software_id": "3d1bfbab-d9ec-46c7-aa8e-9c1d1808f2b8",
-                    "software_version_id": "cd987859-06fe-4b1a-9e96-47d4f36bf819",
-                    "tags": ["tag1"]
-                },
-                indent=4,
-                sort_keys=True,
+            (
+                software_versions,
+                "update",
+                [SOFTWARE_VERSION_ID],
+                json.dumps(
+                    {
+                        "created_at": "2020-09-16T18:48:06.371563",
+                        "commit": COMMIT,
+                        "commit_date": "2020-09-10T18:48:06.371563",
+                        "software_id": SOFTWARE_ID,
+                        "software_version_id": SOFTWARE_VERSION_ID,
+                        "tags": ["tag1"]
+                    },
+                    indent=4,
+                    sort_keys=True,
+                ),
             ),
-        },
-        {
-            "args": [
+        ),
+        (
+            [
                 "software",
                 "version",
                 "update",
-                "cd987859-06fe-4b1a-9e96-47d4f36bf819",
+                SOFTWARE_VERSION_ID,
             ],
-            "return": json.dumps(
-                {
-                    "title": "No software_version found",
-                    "status": 404,
-                    "detail": "No software_version found with the specified ID",
-                },
-                indent=4,
-                sort_keys=True,
+            (
+                software_versions,
+                "update",
+                [SOFTWARE_VERSION_ID],
+                json.dumps(
+                    {
+                        "title": "No software_version found",
+                        "status": 404,
+                        "detail": "No software_version found with the specified ID",
+                    },
+                    indent=4,
+                    sort_keys=True,
+                ),
             ),
-        },
-    ]
+        ),
+    ],
+    indirect=["rest_stub"],
 )
-def update_data(request):
-    # Set all requests to return None so only the one we expect will return a value
-    mockito.when(software_versions).update(...).thenReturn(None)
-    # Mock up request response
-    mockito.when(software_versions).update(request.param["args"][3]).thenReturn(
-        request.param["return"]
-    )
-    return request.param
-
-
-def test_update(update_data):
+def test_update(args, rest_stub):
     runner = CliRunner()
-    test_software_version = runner.invoke(carrot, update_data["args"])
-    assert test_software_version.output == update_data["return"] + "\n"
+    test_software_version = runner.invoke(carrot, args)
+    assert test_software_version.output == rest_stub + "\n"
@@ -5,8 +5,41 @@ from click.testing import CliRunner
 import mockito
 import pytest
 from carrot_cli.__main__ import main_entry as carrot
-from carrot_cli.config import manager as config
 from carrot_cli.rest import software
+from tests.unit.mock_util import answer_for
+
+SOFTWARE_ID = "cd987859-06fe-4b1a-9e96-47d4f36bf819"
+MISSING_SOFTWARE_ID = "986325ba-06fe-4b1a-9e96-47d4f36bf819"
+
+pytestmark = pytest.mark.usefixtures("no_email")
+
+# Software records returned by more than one case, serialized once
+SOFTWARE_JSON = json.dumps(
+    {
+        "created_at": "2020-09-16T18:48:06.371563",
+        "created_by": "adora@example.com",
+        "repository_url": "example.com/repo.git",
+        "machine_type": "n1-highcpu-8",
+        "description": "This software will save Etheria",
+        "name": "Sword of Protection software",
+        "software_id": SOFTWARE_ID,
+    },
+    indent=4,
+    sort_keys=True,
+)
+UPDATED_SOFTWARE_JSON = json.dumps(
+    {
+        "created_at": "2020-09-16T18:48:06.371563",
+        "created_by": "adora@example.com",
+        "repository_url": "example.com/repo.git",
+        "machine_type": "n1-highcpu-8",
+        "description": "This new software replaced the broken one",
+        "name": "New Sword of Protection software",
+        "software_id": SOFTWARE_ID,
+    },
+    indent=4,
+    sort_keys=True,
+)
 
 
 @pytest.fixture(autouse=True)
@@ -15,67 +48,73 @@ def unstub():
     mockito.unstub()
 
 
-@pytest.fixture(autouse=True)
-def no_email():
-    mockito.when(config).load_var_no_error("email").thenReturn(None)
-
-
-@pytest.fixture(
-    params=[
-        {
-            "args": ["software", "find_by_id", "cd987859-06fe-4b1a-9e96-47d4f36bf819"],
-            "return": json.dumps(
-                {
-                    "created_at": "2020-09-16T18:48:06.371563",
-                    "created_by": "adora@example.com",
-                    "repository_url": "example.com/repo.git",
-                    "machine_type": "standard",
-                    "description": "This software will save Etheria",
-                    "name": "Sword of Protection software",
-                    "software_id": "cd987859-06fe-4b1a-9e96-47d4f36bf819",
-                },
-                indent=4,
-                sort_keys=True,
+@pytest.mark.parametrize(
+    "args,rest_stub",
+    [
+        (
+            ["software", "find_by_id", SOFTWARE_ID],
+            (
+                software,
+                "find_by_id",
+                [SOFTWARE_ID],
+                json.dumps(
+                    {
+                        "created_at": "2020-09-16T18:48:06.371563",
+                        "created_by": "adora@example.com",
+                        "repository_url": "example.com/repo.git",
+                        "machine_type": "standard",
+                        "description": "This software will save Etheria",
+                        "name": "Sword of Protection software",
+                        "software_id": SOFTWARE_ID,
+                    },
+                    indent=4,
+                    sort_keys=True,
+                ),
             ),
-        },
-        {
-            "args": ["software", "find_by_id", "cd987859-06fe-4b1a-9e96-47d4f36bf819"],
-            "return": json.dumps(
-                {
-                    "title": "No software found",
-                    "status": 404,
-                    "detail": "No software found with the specified ID",
-                },
-                indent=4,
-                sort_keys=True,
+        ),
+        (
+            ["software", "find_by_id", SOFTWARE_ID],
+            (
+                software,
+                "find_by_id",
+                [SOFTWARE_ID],
+                json.dumps(
+                    {
+                        "title": "No software found",
+                        "status": 404,
+                        "detail": "No software found with the specified ID",
+                    },
+                    indent=4,
+                    sort_keys=True,
+                ),
             ),
-        },
-    ]
+        ),
+    ],
+    indirect=["rest_stub"],
 )
-def find_by_id_data(request):
-    # Set all requests to return None so only the one we expect will return a value
-    mockito.when(software).find_by_id(...).thenReturn(None)
-    # Mock up request response
-    mockito.when(software).find_by_id(request.param["args"][2]).thenReturn(
-        request.param["return"]
-    )
-    return request.param
+def test_find_by_id(args, rest_stub):
+    runner = CliRunner()
+    test_software = runner.invoke(carrot, args)
+    assert test_software.output == rest_stub + "\n"
 
 
-def test_find_by_id(find_by_id_data):
-    runner = CliRunner()
-    test_software = runner.invoke(carrot, find_by_id_data["args"])
-    assert test_software.output == find_by_id_data["return"] + "\n"
+def stub_find(find_data):
+    """Mocks up the find request for the find_data case"""
+    # Mock up request response, with any other request returning None
+    mockito.when(software).find(...).thenAnswer(
+        answer_for(find_data["params"], find_data["return"])
+    )
 
 
-@pytest.fixture(
-    params=[
+@pytest.mark.parametrize(
+    "find_data",
+    [
         {
-            "args": [
+            "args": (
                 "software",
                 "find",
                 "--software_id",
-                "cd987859-06fe-4b1a-9e96-47d4f36bf819",
+                SOFTWARE_ID,
                 "--name",
                 "Sword of Protection software",
                 "--description",
@@ -96,9 +135,9 @@ def test_find_by_id(find_by_id_data):
                 1,
                 "--offset",
                 0,
-            ],
-            "params": [
-                "cd987859-06fe-4b1a-9e96-47d4f36bf819",
+            ),
+            "params": (
+                SOFTWARE_ID,
                 "Sword of Protection software",
                 "This software will save Etheria",
                 "example.com/repo.git",
@@ -109,30 +148,18 @@ def test_find_by_id(find_by_id_data):
                 "asc(name)",
                 1,
                 0,
-            ],
-            "return": json.dumps(
-                {
-                    "created_at": "2020-09-16T18:48:06.371563",
-                    "created_by": "adora@example.com",
-                    "repository_url": "example.com/repo.git",
-                    "machine_type": "n1-highcpu-8",
-                    "description": "This software will save Etheria",
-                    "name": "Sword of Protection software",
-                    "software_id": "cd987859-06fe-4b1a-9e96-47d4f36bf819",
-                },
-                indent=4,
-                sort_keys=True,
             ),
+            "return": SOFTWARE_JSON,
         },
         {
-            "args": [
+            "args": (
                 "software",
                 "find",
                 "--software_id",
-                "986325ba-06fe-4b1a-9e96-47d4f36bf819",
-            ],
-            "params": [
-                "986325ba-06fe-4b1a-9e96-47d4f36bf819",
+                MISSING_SOFTWARE_ID,
+            ),
+            "params": (
+                MISSING_SOFTWARE_ID,
                 None,
                 None,
                 None,
@@ -143,7 +170,7 @@ def test_find_by_id(find_by_id_data):
                 None,
                 20,
                 0,
-            ],
+            ),
             "return": json.dumps(
                 {
                     "title": "No software found",
@@ -154,36 +181,26 @@ def test_find_by_id(find_by_id_data):
                 sort_keys=True,
             ),
         },
-    ]
+    ],
 )
-def find_data(request):
-    # Set all requests to return None so only the one we expect will return a value
-    mockito.when(software).find(...).thenReturn(None)
-    # Mock up request response
-    mockito.when(software).find(
-        request.param["params"][0],
-        request.param["params"][1],
-        request.param["params"][2],
-        request.param["params"][3],
-        request.param["params"][4],
-        request.param["params"][5],
-        request.param["params"][6],
-        request.param["params"][7],
-        request.param["params"][8],
-        request.param["params"][9],
-        request.param["params"][10],
-    ).thenReturn(request.param["return"])
-    return request.param
-
-
 def test_find(find_data):
+    stub_find(find_data)
     runner = CliRunner()
     test_software = runner.invoke(carrot, find_data["args"])
     assert test_software.output == find_data["return"] + "\n"
 
 
-@pytest.fixture(
-    params=[
+def stub_create(create_data):
+    """Mocks up the create request for the create_data case"""
+    # Mock up request response, with any other request returning None
+    mockito.when(software).create(...).thenAnswer(
+        answer_for(create_data["params"], create_data["return"])
+    )
+
+
+@pytest.mark.parametrize(
+    "create_data",
+    [
         {
             "args": [
                 "software",
@@ -206,78 +223,73 @@ def test_find(find_data):
                 "n1-highcpu-8",
                 "adora@example.com",
             ],
-            "return": json.dumps(
-                {
-                    "created_at": "2020-09-16T18:48:06.371563",
-                    "created_by": "adora@example.com",
-                    "repository_url": "example.com/repo.git",
-                    "machine_type": "n1-highcpu-8",
-                    "description": "This software will save Etheria",
-                    "name": "Sword of Protection software",
-                    "software_id": "cd987859-06fe-4b1a-9e96-47d4f36bf819",
-                },
-                indent=4,
-                sort_keys=True,
-            ),
-        },
-        {
-            "args": [
-                "software",
-                "create",
-                "--name",
-                "Sword of Protection software",
-                "--description",
-                "This software will save Etheria",
-                "--repository_url",
-                "example.com/repo.git",
-                "--machine_type",
-                "n1-highcpu-8",
-            ],
-            "params": [],
-            "logging": "No email config variable set.  If a value is not specified for --created_by, "
-            "there must be a value set for email.",
-        },
-        {
-            "args": ["software", "create"],
-            "params": [],
-            "return": "Usage: carrot_cli software create [OPTIONS]\n"
-            "Try 'carrot_cli software create -h' for help.\n"
-            "\n"
-            "Error: Missing option '--name'.",
+            "return": SOFTWARE_JSON,
         },
-    ]
+    ],
 )
-def create_data(request):
-    # Set all requests to return None so only the one we expect will return a value
-    mockito.when(software).create(...).thenReturn(None)
-    # Mock up request response only if we expect it to get that far
-    if len(request.param["params"]) > 0:
-        mockito.when(software).create(
-            request.param["params"][0],
-            request.param["params"][1],
-            request.param["params"][2],
-            request.param["params"][3],
-            request.param["params"][4],
-        ).thenReturn(request.param["return"])
-    return request.param
+def test_create(create_data):
+    stub_create(create_data)
+    runner = CliRunner()
+    test_software = runner.invoke(carrot, create_data["args"])
+    assert test_software.output == create_data["return"] + "\n"
 
 
-def test_create(create_data, caplog):
+def test_create_no_email(caplog):
+    args = [
+        "software",
+        "create",
+        "--name",
+        "Sword of Protection software",
+        "--description",
+        "This software will save Etheria",
+        "--repository_url",
+        "example.com/repo.git",
+        "--machine_type",
+        "n1-highcpu-8",
+    ]
     runner = CliRunner()
-    test_software = runner.invoke(carrot, create_data["args"])
-    if "logging" in create_data:
-        assert create_data["logging"] in caplog.text
-    else:
-        assert test_software.output == create_data["return"] + "\n"
+    runner.invoke(carrot, args)
+    assert (
+        "No email config variable set.  If a value is not specified for --created_by, "
+        "there must be a value set for email."
+    ) in caplog.text
 
 
-@pytest.fixture(
-    params=[
+def test_create_missing_name():
+    runner = CliRunner()
+    test_software = runner.invoke(carrot, ["software", "create"])
+    assert test_software.output == (
+        "Usage: carrot_cli software create [OPTIONS]\n"
+        "Try 'carrot_cli software create -h' for help.\n"
+        "\n"
+        "Error: Missing option '--name'.\n"
+    )
+
+
+def stub_update(update_data):
+    """Mocks up the update request and software name lookup for the update_data case"""
+    # If there's a value for from_name, set the return value for trying to retrieve the existing
+    # record
+    from_name = update_data.get("from_name")
+    if from_name:
+        mockito.when(software).find(
+            name=from_name["name"],
+            limit=2
+        ).thenReturn(from_name["return"])
+    # Mock up request response, with any other request returning None
+    mockito.when(software).update(...).thenAnswer(
+        answer_for(update_data["params"], update_data["return"])
+    )
+
+
+@pytest.mark.parametrize(
+    "update_data",
+    [
         {
             "args": [
                 "software",
                 "update",
-                "cd987859-06fe-4b1a-9e96-47d4f36bf819",
+                SOFTWARE_ID,
                 "--description",
                 "This new software replaced the broken one",
                 "--machine_type",
@@ -286,30 +298,18 @@ def test_create(create_data, caplog):
                 "New Sword of Protection software",
             ],
             "params": [
-                "cd987859-06fe-4b1a-9e96-47d4f36bf819",
+                SOFTWARE_ID,
                 "New Sword of Protection software",
                 "This new software replaced the broken one",
                 "n1-highcpu-8",
             ],
-            "return": json.dumps(
-                {
-                    "created_at": "2020-09-16T18:48:06.371563",
-                    "created_by": "adora@example.com",
-                    "repository_url": "example.com/repo.git",
-                    "machine_type": "n1-highcpu-8",
-                    "description": "This new software replaced the broken one",
-                    "name": "New Sword of Protection software",
-                    "software_id": "cd987859-06fe-4b1a-9e96-47d4f36bf819",
-                },
-                indent=4,
-                sort_keys=True,
-            ),
+            "return": UPDATED_SOFTWARE_JSON,
         },
         {
             "args": [
                 "software",
                 "update",
-                "cd987859-06fe-4b1a-9e96-47d4f36bf819",
+                SOFTWARE_ID,
                 "--description",
                 "This new software replaced the broken one",
                 "--machine_type",
@@ -318,7 +318,7 @@ def test_create(create_data, caplog):
                 "New Sword of Protection software",
             ],
             "params": [
-                "cd987859-06fe-4b1a-9e96-47d4f36bf819",
+                SOFTWARE_ID,
                 "New Sword of Protection software",
                 "This new software replaced the broken one",
                 "n1-highcpu-8",
@@ -334,59 +334,30 @@ def test_create(create_data, caplog):
                             "machine_type": "standard",
                             "description": "This new software replaced the broken one",
                             "name": "New Sword of Protection software",
-                            "software_id": "cd987859-06fe-4b1a-9e96-47d4f36bf819",
+                            "software_id": SOFTWARE_ID,
                         }
                     ],
                     indent=4,
                     sort_keys=True,
                 )
             },
-            "return": json.dumps(
-                {
-                    "created_at": "2020-09-16T18:48:06.371563",
-                    "created_by": "adora@example.com",
-                    "repository_url": "example.com/repo.git",
-                    "machine_type": "n1-highcpu-8",
-                    "description": "This new software replaced the broken one",
-                    "name": "New Sword of Protection software",
-                    "software_id": "cd987859-06fe-4b1a-9e96-47d4f36bf819",
-                },
-                indent=4,
-                sort_keys=True,
-            ),
-        },
-        {
-            "args": ["software", "update"],
-            "params": [],
-            "return": "Usage: carrot_cli software update [OPTIONS] SOFTWARE\n"
-            "Try 'carrot_cli software update -h' for help.\n"
-            "\n"
-            "Error: Missing argument 'SOFTWARE'.",
+            "return": UPDATED_SOFTWARE_JSON,
         },
-    ]
+    ],
 )
-def update_data(request):
-    # Set all requests to return None so only the one we expect will return a value
-    mockito.when(software).update(...).thenReturn(None)
-    # If there's a value for from_name, set the return value for trying to retrieve the existing
-    # record
-    if "from_name" in request.param:
-        mockito.when(software).find(
-            name=request.param["from_name"]["name"],
-            limit=2
-        ).thenReturn(request.param["from_name"]["return"])
-    # Mock up request response only if we expect it to get that far
-    if len(request.param["params"]) > 0:
-        mockito.when(software).update(
-            request.param["params"][0],
-            request.param["params"][1],
-            request.param["params"][2],
-            request.param["params"][3],
-        ).thenReturn(request.param["return"])
-    return request.param
-
-
 def test_update(update_data):
+    stub_update(update_data)
     runner = CliRunner()
     test_software = runner.invoke(carrot, update_data["args"])
     assert test_software.output == update_data["return"] + "\n"
+
+
+def test_update_missing_software():
+    runner = CliRunner()
+    test_software = runner.invoke(carrot, ["software", "update"])
+    assert test_software.output == (
+        "Usage: carrot_cli software update [OPTIONS] SOFTWARE\n"
+        "Try 'carrot_cli software update -h' for help.\n"
+        "\n"
+        "Error: Missing argument 'SOFTWARE'.\n"
+    )
@@ -1,13 +1,347 @@
 import json
 import logging
 
-from click.testing import CliRunner
-
 import mockito
 import pytest
 from carrot_cli.__main__ import main_entry as carrot
 from carrot_cli.config import manager as config
 from carrot_cli.rest import pipelines, report_maps, reports, results, runs, template_reports, template_results, templates
+from tests.unit.mock_util import answer_for
+
+TEMPLATE_ID = "cd987859-06fe-4b1a-9e96-47d4f36bf819"
+RESULT_ID = "3d1bfbab-d9ec-46c7-aa8e-9c1d1808f2b8"
+OTHER_RESULT_ID = "4d1bfbab-d9ec-46c7-aa8e-9c1d1808f2b8"
+REPORT_ID = "dd1b6094-b43a-4d98-8873-cc9b38e8b85d"
+OTHER_REPORT_ID = "ed1b6094-b43a-4d98-8873-cc9b38e8b85d"
+
+pytestmark = pytest.mark.usefixtures("no_email")
+
+# Template records and responses returned by more than one case, serialized once
+NO_TEMPLATE_FOUND_JSON = json.dumps(
+    {
+        "title": "No template found",
+        "status": 404,
+        "detail": "No template found with the specified ID",
+    },
+    indent=4,
+    sort_keys=True,
+)
+FOUND_TEMPLATES_JSON = json.dumps(
+    [
+        {
+            "created_at": "2020-09-16T18:48:06.371563",
+            "created_by": "adora@example.com",
+            "description": "This template will save Etheria",
+            "test_wdl": "example.com/rebellion_test.wdl",
+            "eval_wdl": "example.com/rebellion_eval.wdl",
+            "name": "Sword of Protection template",
+            "pipeline_id": "4d1bfbab-d9ec-46c7-aa8e-9c1d1808f2b8",
+            "template_id": TEMPLATE_ID,
+        }
+    ],
+    indent=4,
+    sort_keys=True,
+)
+CREATED_TEMPLATE_JSON = json.dumps(
+    {
+        "created_at": "2020-09-16T18:48:06.371563",
+        "created_by": "adora@example.com",
+        "description": "This template will save Etheria",
+        "test_wdl": "example.com/she-ra_test.wdl",
+        "test_wdl_dependencies": "example.com/she-ra_test_dep.zip",
+        "eval_wdl": "example.com/she-ra_eval.wdl",
+        "eval_wdl_dependencies": "example.com/she-ra_eval_dep.zip",
+        "name": "Sword of Protection template",
+        "pipeline_id": "550e8400-e29b-41d4-a716-446655440000",
+        "template_id": TEMPLATE_ID,
+    },
+    indent=4,
+    sort_keys=True,
+)
+UPDATED_TEMPLATE_JSON = json.dumps(
+    {
+        "created_at": "2020-09-16T18:48:06.371563",
+        "created_by": "adora@example.com",
+        "description": "This template replaced the broken one",
+        "test_wdl": "example.com/she-ra_test.wdl",
+        "test_wdl_dependencies": "example.com/she-ra_test_dep.zip",
+        "eval_wdl": "example.com/she-ra_eval.wdl",
+        "eval_wdl_dependencies": "example.com/she-ra_eval_dep.zip",
+        "name": "New Sword of Protection template",
+        "pipeline_id": "4d1bfbab-d9ec-46c7-aa8e-9c1d1808f2b8",
+        "template_id": TEMPLATE_ID,
+    },
+    indent=4,
+    sort_keys=True,
+)
+NEW_TEMPLATE = {
+    "created_at": "2020-09-16T18:48:06.371563",
+    "created_by": "adora@example.com",
+    "description": "This template replaced the broken one",
+    "test_wdl": "example.com/she-ra_test.wdl",
+    "eval_wdl": "example.com/she-ra_eval.wdl",
+    "name": "New Sword of Protection template",
+    "pipeline_id": "4d1bfbab-d9ec-46c7-aa8e-9c1d1808f2b8",
+    "template_id": TEMPLATE_ID,
+}
+NEW_TEMPLATE_JSON = json.dumps(NEW_TEMPLATE, indent=4, sort_keys=True)
+NEW_TEMPLATES_JSON = json.dumps([NEW_TEMPLATE], indent=4, sort_keys=True)
+DELETED_JSON = json.dumps(
+    {"message": "Successfully deleted 1 row"}, indent=4, sort_keys=True
+)
+FOUND_RUNS_JSON = json.dumps(
+    [
+        {
+            "created_at": "2020-09-16T18:48:06.371563",
+            "finished_at": "2020-09-16T18:58:06.371563",
+            "created_by": "glimmer@example.com",
+            "test_input": {"in_greeted": "Cool Person", "docker": "image_build:test_software|1.1.0"},
+            "test_options": {"option": "other_value"},
+            "eval_input": {"in_output_filename": "test_greeting.txt"},
+            "eval_options": {"option": "value"},
+            "status": "succeeded",
+            "results": {},
+            "run_group_id": "ad487859-06fe-4b1a-9e96-47d4f36bf819",
+            "test_cromwell_job_id": "d9855002-6b71-429c-a4de-8e90222488cd",
+            "eval_cromwell_job_id": "03958293-6b71-429c-a4de-8e90222488cd",
+            "name": "Queen of Bright Moon run",
+            "test_id": "3d1bfbab-d9ec-46c7-aa8e-9c1d1808f2b8",
+            "run_id": "cd987859-06fe-4b1a-9e96-47d4f36bf819",
+        }
+    ],
+    indent=4,
+    sort_keys=True,
+)
+NO_RUNS_FOUND_JSON = json.dumps(
+    {
+        "title": "No run found",
+        "status": 404,
+        "detail": "No runs found with the specified parameters",
+    },
+    indent=4,
+    sort_keys=True,
+)
+RUN_GROUP_REPORT_MAP_JSON = json.dumps(
+    {
+        "entity_id": "128abc85-06fe-4b1a-9e96-47d4f36bf819",
+        "entity_type": "run_group",
+        "report_id": REPORT_ID,
+        "status": "created",
+        "results": {},
+        "cromwell_job_id": "8f1bfbab-d9ec-46c7-aa8e-9c1d1808f2b8",
+        "created_at": "2020-09-24T19:07:59.311462",
+        "created_by": "adora@example.com",
+        "finished_at": None,
+    },
+    indent=4,
+    sort_keys=True,
+)
+NETOSSA_SUBSCRIPTION_JSON = json.dumps(
+    {
+        "subscription_id": "361b3b95-4a6e-40d9-bd98-f92b2959864e",
+        "entity_type": "template",
+        "entity_id": TEMPLATE_ID,
+        "email": "netossa@example.com",
+        "created_at": "2020-09-23T19:41:46.839880",
+    },
+    indent=4,
+    sort_keys=True,
+)
+TEMPLATE_RESULT_MAP_JSON = json.dumps(
+    {
+        "template_id": TEMPLATE_ID,
+        "result_id": RESULT_ID,
+        "result_key": "out_horde_tanks",
+        "created_at": "2020-09-24T19:07:59.311462",
+        "created_by": "rogelio@example.com",
+    },
+    indent=4,
+    sort_keys=True,
+)
+UNSUBSCRIBED_JSON = json.dumps(
+    {"message": "Successfully deleted 1 row(s)"}, indent=4, sort_keys=True
+)
+# Report notebook returned by every report lookup in these cases
+NOTEBOOK = {
+    "metadata": {
+        "language_info": {
+            "codemirror_mode": {"name": "ipython", "version": 3},
+            "file_extension": ".py",
+            "mimetype": "text/x-python",
+            "name": "python",
+            "nbconvert_exporter": "python",
+            "pygments_lexer": "ipython3",
+            "version": "3.8.5-final",
+        },
+        "orig_nbformat": 2,
+        "kernelspec": {
+            "name": "python3",
+            "display_name": "Python 3.8.5 64-bit",
+            "metadata": {
+                "interpreter": {
+                    "hash": "1ee38ef4a5a9feb55287fd749643f13d043cb0a7addaab2a9c224cbe137c0062"
+                }
+            },
+        },
+    },
+    "nbformat": 4,
+    "nbformat_minor": 2,
+    "cells": [
+        {
+            "cell_type": "code",
+            "execution_count": None,
+            "metadata": {},
+            "outputs": [],
+            "source": [
+                'message = carrot_run_data["results"]["Greeting"]\n',
+                "print(message)",
+            ],
+        },
+        {
+            "cell_type": "code",
+            "execution_count": None,
+            "metadata": {},
+            "outputs": [],
+            "source": [
+                'message_file = open(carrot_downloads["results"]["File Result"], \'r\')\n',
+                "print(message_file.read())",
+            ],
+        },
+        {
+            "cell_type": "code",
+            "execution_count": None,
+            "metadata": {},
+            "outputs": [],
+            "source": ["print('Thanks')"],
+        },
+    ],
+}
+# Records returned by the result and report map cases, each shared by more than one case
+HORDE_TEMPLATES_JSON = json.dumps(
+    [
+        {
+            "created_at": "2020-09-16T18:48:06.371563",
+            "created_by": "adora@example.com",
+            "description": "This template is for horde stuff",
+            "test_wdl": "example.com/she-ra_test.wdl",
+            "eval_wdl": "example.com/she-ra_eval.wdl",
+            "name": "Horde Template",
+            "pipeline_id": "4d1bfbab-d9ec-46c7-aa8e-9c1d1808f2b8",
+            "template_id": TEMPLATE_ID,
+        }
+    ],
+    indent=4,
+    sort_keys=True,
+)
+HORDE_TANKS_RESULTS_JSON = json.dumps(
+    [
+        {
+            "created_at": "2020-09-16T18:48:06.371563",
+            "created_by": "adora@example.com",
+            "result_type": "numeric",
+            "description": "How many tanks",
+            "name": "Horde Tanks",
+            "result_id": RESULT_ID,
+        }
+    ],
+    indent=4,
+    sort_keys=True,
+)
+SWORD_RESULT_MAPS_JSON = json.dumps(
+    [
+        {
+            "template_id": TEMPLATE_ID,
+            "result_id": OTHER_RESULT_ID,
+            "result_key": "sword_of_protection_key",
+            "created_at": "2020-09-24T19:07:59.311462",
+            "created_by": "adora@example.com",
+        }
+    ],
+    indent=4,
+    sort_keys=True,
+)
+SWORD_RESULT_MAP_JSON = json.dumps(
+    {
+        "template_id": TEMPLATE_ID,
+        "result_id": OTHER_RESULT_ID,
+        "result_key": "sword_of_protection_key",
+        "created_at": "2020-09-24T19:07:59.311462",
+        "created_by": "adora@example.com",
+    },
+    indent=4,
+    sort_keys=True,
+)
+NO_RESULT_MAP_FOUND_JSON = json.dumps(
+    {
+        "title": "No template_result found",
+        "status": 404,
+        "detail": "No template_result found with the specified ID",
+    },
+    indent=4,
+    sort_keys=True,
+)
+TEMPLATE_REPORT_MAP_JSON = json.dumps(
+    {
+        "template_id": TEMPLATE_ID,
+        "report_id": REPORT_ID,
+        "report_trigger": "single",
+        "created_at": "2020-09-24T19:07:59.311462",
+        "created_by": "rogelio@example.com",
+    },
+    indent=4,
+    sort_keys=True,
+)
+HORDE_REPORTS_JSON = json.dumps(
+    [
+        {
+            "config": {"cpu": 2},
+            "created_at": "2020-09-16T18:48:06.371563",
+            "created_by": "adora@example.com",
+            "description": "This old report is old",
+            "name": "Horde Report",
+            "notebook": NOTEBOOK,
+            "report_id": REPORT_ID,
+        }
+    ],
+    indent=4,
+    sort_keys=True,
+)
+TEMPLATE_REPORT_MAP_WITH_INPUTS_JSON = json.dumps(
+    {
+        "template_id": TEMPLATE_ID,
+        "report_id": REPORT_ID,
+        "report_trigger": "single",
+        "input_map": {"section1": {"input1": "val1"}},
+        "created_at": "2020-09-24T19:07:59.311462",
+        "created_by": "rogelio@example.com",
+    },
+    indent=4,
+    sort_keys=True,
+)
+TEMPLATE_REPORT_MAPS_JSON = json.dumps(
+    [
+        {
+            "template_id": TEMPLATE_ID,
+            "report_id": OTHER_REPORT_ID,
+            "report_trigger": "single",
+            "created_at": "2020-09-24T19:07:59.311462",
+            "created_by": "adora@example.com",
+        }
+    ],
+    indent=4,
+    sort_keys=True,
+)
+ADORA_TEMPLATE_REPORT_MAP_JSON = json.dumps(
+    {
+        "template_id": TEMPLATE_ID,
+        "report_id": REPORT_ID,
+        "report_trigger": "single",
+        "created_at": "2020-09-24T19:07:59.311462",
+        "created_by": "adora@example.com",
+    },
+    indent=4,
+    sort_keys=True,
+)
 
 
 @pytest.fixture(autouse=True)
@@ -16,68 +350,92 @@ def unstub():
     mockito.unstub()
 
 
-@pytest.fixture(autouse=True)
-def no_email():
-    mockito.when(config).load_var_no_error("email").thenReturn(None)
+def missing_template_usage(command, arguments):
+    """
+    Returns the usage error click prints for a template subcommand run without its TEMPLATE
+    argument
+    """
+    return (
+        f"Usage: carrot_cli template {command} [OPTIONS] {arguments}\n"
+        f"Try 'carrot_cli template {command} -h' for help.\n"
+        "\n"
+        "Error: Missing argument 'TEMPLATE'."
+    )
 
 
-@pytest.fixture(
-    params=[
-        {
-            "args": ["template", "find_by_id", "cd987859-06fe-4b1a-9e96-47d4f36bf819"],
-            "return": json.dumps(
-                {
-                    "created_at": "2020-09-16T18:48:06.371563",
-                    "created_by": "adora@example.com",
-                    "description": "This template will save Etheria",
-                    "test_wdl": "example.com/she-ra_test.wdl",
-                    "eval_wdl": "example.com/she-ra_eval.wdl",
-                    "name": "Sword of Protection template",
-                    "pipeline_id": "3d1bfbab-d9ec-46c7-aa8e-9c1d1808f2b8",
-                    "template_id": "cd987859-06fe-4b1a-9e96-47d4f36bf819",
-                },
-                indent=4,
-                sort_keys=True,
-            ),
-        },
-        {
-            "args": ["template", "find_by_id", "cd987859-06fe-4b1a-9e96-47d4f36bf819"],
-            "return": json.dumps(
-                {
-                    "title": "No template found",
-                    "status": 404,
-                    "detail": "No template found with the specified ID",
-                },
-                indent=4,
-                sort_keys=True,
+@pytest.mark.parametrize(
+    "args,rest_stub",
+    [
+        (
+            ("template", "find_by_id", TEMPLATE_ID),
+            (
+                templates,
+                "find_by_id",
+                [TEMPLATE_ID],
+                json.dumps(
+                    {
+                        "created_at": "2020-09-16T18:48:06.371563",
+                        "created_by": "adora@example.com",
+                        "description": "This template will save Etheria",
+                        "test_wdl": "example.com/she-ra_test.wdl",
+                        "eval_wdl": "example.com/she-ra_eval.wdl",
+                        "name": "Sword of Protection template",
+                        "pipeline_id": "3d1bfbab-d9ec-46c7-aa8e-9c1d1808f2b8",
+                        "template_id": TEMPLATE_ID,
+                    },
+                    indent=4,
+                    sort_keys=True,
+                ),
             ),
-        },
-    ]
+        ),
+        (
+            ("template", "find_by_id", TEMPLATE_ID),
+            (
+                templates,
+                "find_by_id",
+                [TEMPLATE_ID],
+                NO_TEMPLATE_FOUND_JSON,
+            ),
+        ),
+    ],
+    indirect=["rest_stub"],
 )
-def find_by_id_data(request):
-    # Set all requests to return None so only the one we expect will return a value
-    mockito.when(templates).find_by_id(...).thenReturn(None)
-    # Mock up request response
-    mockito.when(templates).find_by_id(request.param["args"][2]).thenReturn(
-        request.param["return"]
-    )
-    return request.param
+def test_find_by_id(args, rest_stub, runner):
+    result = runner.invoke(carrot, args)
+    assert result.output == rest_stub + "\n"
+
+
+def stub_name_lookup(module, lookup):
+    """
+    Mocks up the find request that resolves the name in lookup to its record, if a case has a
+    lookup
+    """
+    if lookup is not None:
+        mockito.when(module).find(name=lookup["name"], limit=2).thenReturn(
+            lookup["return"]
+        )
 
 
-def test_find_by_id(find_by_id_data):
-    runner = CliRunner()
-    result = runner.invoke(carrot, find_by_id_data["args"])
-    assert result.output == find_by_id_data["return"] + "\n"
+def stub_find(find_data):
+    """Mocks up the find request for the find_data case"""
+    # If there's a value for from_name, set the return value for trying to retrieve the existing
+    # record
+    stub_name_lookup(pipelines, find_data.get("from_name"))
+    # Mock up request response, with any other request returning None
+    mockito.when(templates).find(...).thenAnswer(
+        answer_for(find_data["params"], find_data["return"])
+    )
 
 
-@pytest.fixture(
-    params=[
+@pytest.mark.parametrize(
+    "find_data",
+    [
         {
-            "args": [
+            "args": (
                 "template",
                 "find",
                 "--template_id",
-                "cd987859-06fe-4b1a-9e96-47d4f36bf819",
+                TEMPLATE_ID,
                 "--pipeline_id",
                 "4d1bfbab-d9ec-46c7-aa8e-9c1d1808f2b8",
                 "--name",
@@ -100,9 +458,9 @@ def test_find_by_id(find_by_id_data):
                 1,
                 "--offset",
                 0,
-            ],
-            "params": [
-                "cd987859-06fe-4b1a-9e96-47d4f36bf819",
+            ),
+            "params": (
+                TEMPLATE_ID,
                 "4d1bfbab-d9ec-46c7-aa8e-9c1d1808f2b8",
                 "Sword of Protection template",
                 "This template will save Etheria",
@@ -114,30 +472,15 @@ def test_find_by_id(find_by_id_data):
                 "asc(name)",
                 1,
                 0,
-            ],
-            "return": json.dumps(
-                [
-                    {
-                        "created_at": "2020-09-16T18:48:06.371563",
-                        "created_by": "adora@example.com",
-                        "description": "This template will save Etheria",
-                        "test_wdl": "example.com/rebellion_test.wdl",
-                        "eval_wdl": "example.com/rebellion_eval.wdl",
-                        "name": "Sword of Protection template",
-                        "pipeline_id": "4d1bfbab-d9ec-46c7-aa8e-9c1d1808f2b8",
-                        "template_id": "cd987859-06fe-4b1a-9e96-47d4f36bf819",
-                    }
-                ],
-                indent=4,
-                sort_keys=True,
             ),
+            "return": FOUND_TEMPLATES_JSON,
         },
         {
-            "args": [
+            "args": (
                 "template",
                 "find",
                 "--template_id",
-                "cd987859-06fe-4b1a-9e96-47d4f36bf819",
+                TEMPLATE_ID,
                 "--pipeline",
                 "Sword of Protection pipeline",
                 "--name",
@@ -160,9 +503,9 @@ def test_find_by_id(find_by_id_data):
                 1,
                 "--offset",
                 0,
-            ],
-            "params": [
-                "cd987859-06fe-4b1a-9e96-47d4f36bf819",
+            ),
+            "params": (
+                TEMPLATE_ID,
                 "4d1bfbab-d9ec-46c7-aa8e-9c1d1808f2b8",
                 "Sword of Protection template",
                 "This template will save Etheria",
@@ -174,7 +517,7 @@ def test_find_by_id(find_by_id_data):
                 "asc(name)",
                 1,
                 0,
-            ],
+            ),
             "from_name": {
                 "name": "Sword of Protection pipeline",
                 "return": json.dumps(
@@ -191,31 +534,16 @@ def test_find_by_id(find_by_id_data):
                     sort_keys=True,
                 ),
             },
-            "return": json.dumps(
-                [
-                    {
-                        "created_at": "2020-09-16T18:48:06.371563",
-                        "created_by": "adora@example.com",
-                        "description": "This template will save Etheria",
-                        "test_wdl": "example.com/rebellion_test.wdl",
-                        "eval_wdl": "example.com/rebellion_eval.wdl",
-                        "name": "Sword of Protection template",
-                        "pipeline_id": "4d1bfbab-d9ec-46c7-aa8e-9c1d1808f2b8",
-                        "template_id": "cd987859-06fe-4b1a-9e96-47d4f36bf819",
-                    }
-                ],
-                indent=4,
-                sort_keys=True,
-            ),
+            "return": FOUND_TEMPLATES_JSON,
         },
         {
-            "args": [
+            "args": (
                 "template",
                 "find",
                 "--template_id",
                 "986325ba-06fe-4b1a-9e96-47d4f36bf819",
-            ],
-            "params": [
+            ),
+            "params": (
                 "986325ba-06fe-4b1a-9e96-47d4f36bf819",
                 None,
                 None,
@@ -228,7 +556,7 @@ def test_find_by_id(find_by_id_data):
                 None,
                 20,
                 0,
-            ],
+            ),
             "return": json.dumps(
                 {
                     "title": "No templates found",
@@ -239,46 +567,32 @@ def test_find_by_id(find_by_id_data):
                 sort_keys=True,
             ),
         },
-    ]
+    ],
 )
-def find_data(request):
-    # Set all requests to return None so only the one we expect will return a value
-    mockito.when(templates).find(...).thenReturn(None)
-    # If there's a value for from_name, set the return value for trying to retrieve the existing
-    # record
-    if "from_name" in request.param:
-        mockito.when(pipelines).find(
-            name=request.param["from_name"]["name"],
-            limit=2
-        ).thenReturn(request.param["from_name"]["return"])
-    # Mock up request response
-    mockito.when(templates).find(
-        request.param["params"][0],
-        request.param["params"][1],
-        request.param["params"][2],
-        request.param["params"][3],
-        request.param["params"][4],
-        request.param["params"][5],
-        request.param["params"][6],
-        request.param["params"][7],
-        request.param["params"][8],
-        request.param["params"][9],
-        request.param["params"][10],
-        request.param["params"][11],
-    ).thenReturn(request.param["return"])
-    return request.param
-
-
-def test_find(find_data):
-    runner = CliRunner()
+def test_find(find_data, runner):
+    stub_find(find_data)
     result = runner.invoke(carrot, find_data["args"])
     assert result.output == find_data["return"] + "\n"
 
 
-@pytest.fixture(
-    params=[
+def stub_create(create_data):
+    """Mocks up the create request for the create_data case"""
+    # If there's a value for from_name, set the return value for trying to retrieve the existing
+    # record
+    stub_name_lookup(pipelines, create_data.get("from_name"))
+    # Same for the template to copy, if there is one
+    stub_name_lookup(templates, create_data.get("copy"))
+    # Mock up request response, with any other request returning None
+    mockito.when(templates).create(...).thenAnswer(
+        answer_for(create_data["params"], create_data["return"])
+    )
+
+
+@pytest.mark.parametrize(
+    "create_data",
+    [
         {
-            "args": [
+            "args": (
                 "template",
                 "create",
                 "--pipeline_id",
@@ -297,8 +611,8 @@ def test_find(find_data):
                 "example.com/she-ra_eval_dep.zip",
                 "--created_by",
                 "adora@example.com",
-            ],
-            "params": [
+            ),
+            "params": (
                 "Sword of Protection template",
                 "550e8400-e29b-41d4-a716-446655440000",
                 "This template will save Etheria",
@@ -308,26 +622,11 @@ def test_find(find_data):
                 "example.com/she-ra_eval_dep.zip",
                 "adora@example.com",
                 None
-            ],
-            "return": json.dumps(
-                {
-                    "created_at": "2020-09-16T18:48:06.371563",
-                    "created_by": "adora@example.com",
-                    "description": "This template will save Etheria",
-                    "test_wdl": "example.com/she-ra_test.wdl",
-                    "test_wdl_dependencies": "example.com/she-ra_test_dep.zip",
-                    "eval_wdl": "example.com/she-ra_eval.wdl",
-                    "eval_wdl_dependencies": "example.com/she-ra_eval_dep.zip",
-                    "name": "Sword of Protection template",
-                    "pipeline_id": "550e8400-e29b-41d4-a716-446655440000",
-                    "template_id": "cd987859-06fe-4b1a-9e96-47d4f36bf819",
-                },
-                indent=4,
-                sort_keys=True,
             ),
+            "return": CREATED_TEMPLATE_JSON,
         },
         {
-            "args": [
+            "args": (
                 "template",
                 "create",
                 "--pipeline",
@@ -346,8 +645,8 @@ def test_find(find_data):
                 "example.com/she-ra_eval_dep.zip",
                 "--created_by",
                 "adora@example.com",
-            ],
-            "params": [
+            ),
+            "params": (
                 "Sword of Protection template",
                 "550e8400-e29b-41d4-a716-446655440000",
                 "This template will save Etheria",
@@ -357,7 +656,7 @@ def test_find(find_data):
                 "example.com/she-ra_eval_dep.zip",
                 "adora@example.com",
                 None
-            ],
+            ),
             "from_name": {
                 "name": "Sword of Protection pipeline",
                 "return": json.dumps(
@@ -374,25 +673,10 @@ def test_find(find_data):
                     sort_keys=True,
                 )
             },
-            "return": json.dumps(
-                {
-                    "created_at": "2020-09-16T18:48:06.371563",
-                    "created_by": "adora@example.com",
-                    "description": "This template will save Etheria",
-                    "test_wdl": "example.com/she-ra_test.wdl",
-                    "test_wdl_dependencies": "example.com/she-ra_test_dep.zip",
-                    "eval_wdl": "example.com/she-ra_eval.wdl",
-                    "eval_wdl_dependencies": "example.com/she-ra_eval_dep.zip",
-                    "name": "Sword of Protection template",
-                    "pipeline_id": "550e8400-e29b-41d4-a716-446655440000",
-                    "template_id": "cd987859-06fe-4b1a-9e96-47d4f36bf819",
-                },
-                indent=4,
-                sort_keys=True,
-            ),
+            "return": CREATED_TEMPLATE_JSON,
         },
         {
-            "args": [
+            "args": (
                 "template",
                 "create",
                 "--name",
@@ -407,8 +691,8 @@ def test_find(find_data):
                 "adora2@example.com",
                 "--copy",
                 "Sword of Protection template"
-            ],
-            "params": [
+            ),
+            "params": (
                 "Sword of Protection template copy",
                 None,
                 "This template will save Etheria again",
@@ -417,8 +701,8 @@ def test_find(find_data):
                 None,
                 None,
                 "adora2@example.com",
-                "cd987859-06fe-4b1a-9e96-47d4f36bf819"
-            ],
+                TEMPLATE_ID
+            ),
             "copy": {
                 "name": "Sword of Protection template",
                 "return": json.dumps(
@@ -433,7 +717,7 @@ def test_find(find_data):
                             "eval_wdl_dependencies": "example.com/she-ra_eval_dep.zip",
                             "name": "Sword of Protection template",
                             "pipeline_id": "550e8400-e29b-41d4-a716-446655440000",
-                            "template_id": "cd987859-06fe-4b1a-9e96-47d4f36bf819",
+                            "template_id": TEMPLATE_ID,
                         }
                     ],
                     indent=4,
@@ -457,84 +741,67 @@ def test_find(find_data):
                 sort_keys=True,
             ),
         },
-        {
-            "args": [
-                "template",
-                "create",
-                "--pipeline_id",
-                "550e8400-e29b-41d4-a716-446655440000",
-                "--name",
-                "Sword of Protection template",
-                "--description",
-                "This template will save Etheria",
-                "--test_wdl",
-                "example.com/she-ra_test.wdl",
-                "--test_wdl_dependencies",
-                "example.com/she-ra_test_dep.zip",
-                "--eval_wdl",
-                "example.com/she-ra_eval.wdl",
-                "--eval_wdl_dependencies",
-                "example.com/she-ra_eval_dep.zip",
-            ],
-            "params": [],
-            "logging": "No email config variable set.  If a value is not specified for --created_by, "
-            "there must be a value set for email.",
-        },
-        {
-            "args": ["template", "create"],
-            "params": [],
-            "logging": "If a value is not specified for '--copy', then '--name', '--pipeline', '--test_wdl', and "
-                       "'--eval_wdl are required."
-        },
-    ]
+    ],
 )
-def create_data(request):
-    # Set all requests to return None so only the one we expect will return a value
-    mockito.when(templates).create(...).thenReturn(None)
-    # If there's a value for from_name, set the return value for trying to retrieve the existing
-    # record
-    if "from_name" in request.param:
-        mockito.when(pipelines).find(
-            name=request.param["from_name"]["name"],
-            limit=2
-        ).thenReturn(request.param["from_name"]["return"])
-    if "copy" in request.param:
-        mockito.when(templates).find(
-            name=request.param["copy"]["name"],
-            limit=2
-        ).thenReturn(request.param["copy"]["return"])
-    # Mock up request response only if we expect it to get that far
-    if len(request.param["params"]) > 0:
-        mockito.when(templates).create(
-            request.param["params"][0],
-            request.param["params"][1],
-            request.param["params"][2],
-            request.param["params"][3],
-            request.param["params"][4],
-            request.param["params"][5],
-            request.param["params"][6],
-            request.param["params"][7],
-            request.param["params"][8],
-        ).thenReturn(request.param["return"])
-    return request.param
+def test_create(create_data, runner):
+    stub_create(create_data)
+    result = runner.invoke(carrot, create_data["args"])
+    assert result.output == create_data["return"] + "\n"
+
+
+def test_create_no_email(runner, caplog):
+    args = (
+        "template",
+        "create",
+        "--pipeline_id",
+        "550e8400-e29b-41d4-a716-446655440000",
+        "--name",
+        "Sword of Protection template",
+        "--description",
+        "This template will save Etheria",
+        "--test_wdl",
+        "example.com/she-ra_test.wdl",
+        "--test_wdl_dependencies",
+        "example.com/she-ra_test_dep.zip",
+        "--eval_wdl",
+        "example.com/she-ra_eval.wdl",
+        "--eval_wdl_dependencies",
+        "example.com/she-ra_eval_dep.zip",
+    )
+    runner.invoke(carrot, args)
+    assert (
+        "No email config variable set.  If a value is not specified for --created_by, "
+        "there must be a value set for email."
+    ) in caplog.text
 
 
-def test_create(create_data, caplog):
-    runner = CliRunner()
-    result = runner.invoke(carrot, create_data["args"])
-    if "logging" in create_data:
-        assert create_data["logging"] in caplog.text
-    else:
-        assert result.output == create_data["return"] + "\n"
+def test_create_missing_args(runner, caplog):
+    runner.invoke(carrot, ("template", "create"))
+    assert (
+        "If a value is not specified for '--copy', then '--name', '--pipeline', '--test_wdl', and "
+        "'--eval_wdl are required."
+    ) in caplog.text
 
 
-@pytest.fixture(
-    params=[
+def stub_update(update_data):
+    """Mocks up the update request for the update_data case"""
+    # If there's a value for from_name, set the return value for trying to retrieve the existing
+    # record
+    stub_name_lookup(templates, update_data.get("from_name"))
+    # Mock up request response, with any other request returning None
+    mockito.when(templates).update(...).thenAnswer(
+        answer_for(update_data["params"], update_data["return"])
+    )
+
+
+@pytest.mark.parametrize(
+    "update_data",
+    [
         {
-            "args": [
+            "args": (
                 "template",
                 "update",
-                "cd987859-06fe-4b1a-9e96-47d4f36bf819",
+                TEMPLATE_ID,
                 "--description",
                 "This new template replaced the broken one",
                 "--name",
@@ -547,35 +814,20 @@ def test_create(create_data, caplog):
                 "example.com/she-ra_eval.wdl",
                 "--eval_wdl_dependencies",
                 "example.com/she-ra_eval_dep.zip",
-            ],
-            "params": [
-                "cd987859-06fe-4b1a-9e96-47d4f36bf819",
+            ),
+            "params": (
+                TEMPLATE_ID,
                 "New Sword of Protection template",
                 "This new template replaced the broken one",
                 "example.com/she-ra_test.wdl",
                 "example.com/she-ra_test_dep.zip",
                 "example.com/she-ra_eval.wdl",
                 "example.com/she-ra_eval_dep.zip",
-            ],
-            "return": json.dumps(
-                {
-                    "created_at": "2020-09-16T18:48:06.371563",
-                    "created_by": "adora@example.com",
-                    "description": "This template replaced the broken one",
-                    "test_wdl": "example.com/she-ra_test.wdl",
-                    "test_wdl_dependencies": "example.com/she-ra_test_dep.zip",
-                    "eval_wdl": "example.com/she-ra_eval.wdl",
-                    "eval_wdl_dependencies": "example.com/she-ra_eval_dep.zip",
-                    "name": "New Sword of Protection template",
-                    "pipeline_id": "4d1bfbab-d9ec-46c7-aa8e-9c1d1808f2b8",
-                    "template_id": "cd987859-06fe-4b1a-9e96-47d4f36bf819",
-                },
-                indent=4,
-                sort_keys=True,
             ),
+            "return": UPDATED_TEMPLATE_JSON,
         },
         {
-            "args": [
+            "args": (
                 "template",
                 "update",
                 "Sword of Protection template",
@@ -591,16 +843,16 @@ def test_create(create_data, caplog):
                 "example.com/she-ra_eval.wdl",
                 "--eval_wdl_dependencies",
                 "example.com/she-ra_eval_dep.zip",
-            ],
-            "params": [
-                "cd987859-06fe-4b1a-9e96-47d4f36bf819",
+            ),
+            "params": (
+                TEMPLATE_ID,
                 "New Sword of Protection template",
                 "This new template replaced the broken one",
                 "example.com/she-ra_test.wdl",
                 "example.com/she-ra_test_dep.zip",
                 "example.com/she-ra_eval.wdl",
                 "example.com/she-ra_eval_dep.zip",
-            ],
+            ),
             "from_name": {
                 "name": "Sword of Protection template",
                 "return": json.dumps(
@@ -615,616 +867,276 @@ def test_create(create_data, caplog):
                             "eval_wdl_dependencies": "example.com/she-ra_eval_dep.zip",
                             "name": "Sword of Protection template",
                             "pipeline_id": "4d1bfbab-d9ec-46c7-aa8e-9c1d1808f2b8",
-                            "template_id": "cd987859-06fe-4b1a-9e96-47d4f36bf819",
+                            "template_id": TEMPLATE_ID,
                         }
                     ],
                     indent=4,
                     sort_keys=True,
                 )
             },
-            "return": json.dumps(
-                {
-                    "created_at": "2020-09-16T18:48:06.371563",
-                    "created_by": "adora@example.com",
-                    "description": "This template replaced the broken one",
-                    "test_wdl": "example.com/she-ra_test.wdl",
-                    "test_wdl_dependencies": "example.com/she-ra_test_dep.zip",
-                    "eval_wdl": "example.com/she-ra_eval.wdl",
-                    "eval_wdl_dependencies": "example.com/she-ra_eval_dep.zip",
-                    "name": "New Sword of Protection template",
-                    "pipeline_id": "4d1bfbab-d9ec-46c7-aa8e-9c1d1808f2b8",
-                    "template_id": "cd987859-06fe-4b1a-9e96-47d4f36bf819",
-                },
-                indent=4,
-                sort_keys=True,
-            ),
+            "return": UPDATED_TEMPLATE_JSON,
         },
         {
-            "args": ["template", "update"],
-            "params": [],
-            "return": "Usage: carrot_cli template update [OPTIONS] TEMPLATE\n"
-            "Try 'carrot_cli template update -h' for help.\n"
-            "\n"
-            "Error: Missing argument 'TEMPLATE'.",
+            "args": ("template", "update"),
+            "params": (),
+            "return": missing_template_usage("update", "TEMPLATE"),
         },
-    ]
+    ],
 )
-def update_data(request):
-    # Set all requests to return None so only the one we expect will return a value
-    mockito.when(templates).update(...).thenReturn(None)
-    # If there's a value for from_name, set the return value for trying to retrieve the existing
-    # record
-    if "from_name" in request.param:
-        mockito.when(templates).find(
-            name=request.param["from_name"]["name"],
-            limit=2
-        ).thenReturn(request.param["from_name"]["return"])
-    # Mock up request response only if we expect it to get that far
-    if len(request.param["params"]) > 0:
-        mockito.when(templates).update(
-            request.param["params"][0],
-            request.param["params"][1],
-            request.param["params"][2],
-            request.param["params"][3],
-            request.param["params"][4],
-            request.param["params"][5],
-            request.param["params"][6],
-        ).thenReturn(request.param["return"])
-    return request.param
-
-
-def test_update(update_data):
-    runner = CliRunner()
+def test_update(update_data, runner):
+    stub_update(update_data)
     result = runner.invoke(carrot, update_data["args"])
     assert result.output == update_data["return"] + "\n"
 
 
-@pytest.fixture(
-    params=[
+def stub_delete(delete_data):
+    """Mocks up the delete request for the delete_data case"""
+    # We want to load the value from "email" from config
+    mockito.when(config).load_var("email").thenReturn(delete_data["email"])
+    # If there's a value for from_name, set the return value for trying to retrieve the existing
+    # record
+    stub_name_lookup(templates, delete_data.get("from_name"))
+    # Mock up request responses, with any other request returning None
+    mockito.when(templates).delete(...).thenAnswer(
+        answer_for([delete_data["id"]], delete_data["return"])
+    )
+    mockito.when(templates).find_by_id(...).thenAnswer(
+        answer_for([delete_data["id"]], delete_data["find_return"])
+    )
+
+
+@pytest.mark.parametrize(
+    "delete_data",
+    [
         {
-            "args": ["template", "delete", "cd987859-06fe-4b1a-9e96-47d4f36bf819"],
-            "id": "cd987859-06fe-4b1a-9e96-47d4f36bf819",
-            "find_return": json.dumps(
-                {
-                    "created_at": "2020-09-16T18:48:06.371563",
-                    "created_by": "adora@example.com",
-                    "description": "This template replaced the broken one",
-                    "test_wdl": "example.com/she-ra_test.wdl",
-                    "eval_wdl": "example.com/she-ra_eval.wdl",
-                    "name": "New Sword of Protection template",
-                    "pipeline_id": "4d1bfbab-d9ec-46c7-aa8e-9c1d1808f2b8",
-                    "template_id": "cd987859-06fe-4b1a-9e96-47d4f36bf819",
-                },
-                indent=4,
-                sort_keys=True,
-            ),
+            "args": ("template", "delete", TEMPLATE_ID),
+            "id": TEMPLATE_ID,
+            "find_return": NEW_TEMPLATE_JSON,
             "email": "adora@example.com",
-            "return": json.dumps(
-                {"message": "Successfully deleted 1 row"}, indent=4, sort_keys=True
-            ),
+            "return": DELETED_JSON,
         },
         {
-            "args": ["template", "delete", "New Sword of Protection template"],
-            "id": "cd987859-06fe-4b1a-9e96-47d4f36bf819",
-            "find_return": json.dumps(
-                {
-                    "created_at": "2020-09-16T18:48:06.371563",
-                    "created_by": "adora@example.com",
-                    "description": "This template replaced the broken one",
-                    "test_wdl": "example.com/she-ra_test.wdl",
-                    "eval_wdl": "example.com/she-ra_eval.wdl",
-                    "name": "New Sword of Protection template",
-                    "pipeline_id": "4d1bfbab-d9ec-46c7-aa8e-9c1d1808f2b8",
-                    "template_id": "cd987859-06fe-4b1a-9e96-47d4f36bf819",
-                },
-                indent=4,
-                sort_keys=True,
-            ),
+            "args": ("template", "delete", "New Sword of Protection template"),
+            "id": TEMPLATE_ID,
+            "find_return": NEW_TEMPLATE_JSON,
             "from_name": {
                 "name": "New Sword of Protection template",
-                "return": json.dumps(
-                    [
-                        {
-                            "created_at": "2020-09-16T18:48:06.371563",
-                            "created_by": "adora@example.com",
-                            "description": "This template replaced the broken one",
-                            "test_wdl": "example.com/she-ra_test.wdl",
-                            "eval_wdl": "example.com/she-ra_eval.wdl",
-                            "name": "New Sword of Protection template",
-                            "pipeline_id": "4d1bfbab-d9ec-46c7-aa8e-9c1d1808f2b8",
-                            "template_id": "cd987859-06fe-4b1a-9e96-47d4f36bf819",
-                        }
-                    ],
-                    indent=4,
-                    sort_keys=True,
-                )
+                "return": NEW_TEMPLATES_JSON
             },
             "email": "adora@example.com",
-            "return": json.dumps(
-                {"message": "Successfully deleted 1 row"}, indent=4, sort_keys=True
-            ),
+            "return": DELETED_JSON,
         },
         {
-            "args": [
+            "args": (
                 "template",
                 "delete",
                 "-y",
-                "cd987859-06fe-4b1a-9e96-47d4f36bf819",
-            ],
-            "id": "cd987859-06fe-4b1a-9e96-47d4f36bf819",
-            "find_return": json.dumps(
-                {
-                    "created_at": "2020-09-16T18:48:06.371563",
-                    "created_by": "adora@example.com",
-                    "description": "This template replaced the broken one",
-                    "test_wdl": "example.com/she-ra_test.wdl",
-                    "eval_wdl": "example.com/she-ra_eval.wdl",
-                    "name": "New Sword of Protection template",
-                    "pipeline_id": "4d1bfbab-d9ec-46c7-aa8e-9c1d1808f2b8",
-                    "template_id": "cd987859-06fe-4b1a-9e96-47d4f36bf819",
-                },
-                indent=4,
-                sort_keys=True,
+                TEMPLATE_ID,
             ),
+            "id": TEMPLATE_ID,
+            "find_return": NEW_TEMPLATE_JSON,
             "email": "catra@example.com",
-            "return": json.dumps(
-                {"message": "Successfully deleted 1 row"}, indent=4, sort_keys=True
-            ),
+            "return": DELETED_JSON,
         },
         {
-            "args": ["template", "delete", "cd987859-06fe-4b1a-9e96-47d4f36bf819"],
-            "id": "cd987859-06fe-4b1a-9e96-47d4f36bf819",
-            "find_return": json.dumps(
-                {
-                    "created_at": "2020-09-16T18:48:06.371563",
-                    "created_by": "adora@example.com",
-                    "description": "This template replaced the broken one",
-                    "test_wdl": "example.com/she-ra_test.wdl",
-                    "eval_wdl": "example.com/she-ra_eval.wdl",
-                    "name": "New Sword of Protection template",
-                    "pipeline_id": "4d1bfbab-d9ec-46c7-aa8e-9c1d1808f2b8",
-                    "template_id": "cd987859-06fe-4b1a-9e96-47d4f36bf819",
-                },
-                indent=4,
-                sort_keys=True,
-            ),
+            "args": ("template", "delete", TEMPLATE_ID),
+            "id": TEMPLATE_ID,
+            "find_return": NO_TEMPLATE_FOUND_JSON,
+            "email": "adora@example.com",
+            "return": NO_TEMPLATE_FOUND_JSON,
+        },
+    ],
+    ids=["by_id", "by_name", "yes_flag", "not_found"],
+)
+def test_delete(delete_data, runner):
+    stub_delete(delete_data)
+    result = runner.invoke(carrot, delete_data["args"])
+    assert result.output == delete_data["return"] + "\n"
+
+
+@pytest.mark.parametrize(
+    "delete_data",
+    [
+        {
+            "args": ("template", "delete", TEMPLATE_ID),
+            "id": TEMPLATE_ID,
+            "find_return": NEW_TEMPLATE_JSON,
             "email": "catra@example.com",
-            "return": json.dumps(
-                {"message": "Successfully deleted 1 row"}, indent=4, sort_keys=True
-            ),
+            "return": DELETED_JSON,
             "interactive": {
                 "input": "y",
-                "message": "Template with id cd987859-06fe-4b1a-9e96-47d4f36bf819 was created by adora@example.com. "
+                "message": f"Template with id {TEMPLATE_ID} was created by adora@example.com. "
                 "Are you sure you want to delete? [y/N]: y\n",
             },
         },
         {
-            "args": ["template", "delete", "cd987859-06fe-4b1a-9e96-47d4f36bf819"],
-            "id": "cd987859-06fe-4b1a-9e96-47d4f36bf819",
-            "find_return": json.dumps(
-                {
-                    "created_at": "2020-09-16T18:48:06.371563",
-                    "created_by": "adora@example.com",
-                    "description": "This template replaced the broken one",
-                    "test_wdl": "example.com/she-ra_test.wdl",
-                    "eval_wdl": "example.com/she-ra_eval.wdl",
-                    "name": "New Sword of Protection template",
-                    "pipeline_id": "4d1bfbab-d9ec-46c7-aa8e-9c1d1808f2b8",
-                    "template_id": "cd987859-06fe-4b1a-9e96-47d4f36bf819",
-                },
-                indent=4,
-                sort_keys=True,
-            ),
+            "args": ("template", "delete", TEMPLATE_ID),
+            "id": TEMPLATE_ID,
+            "find_return": NEW_TEMPLATE_JSON,
             "email": "catra@example.com",
             "return": "",
             "interactive": {
                 "input": "n",
-                "message": "Template with id cd987859-06fe-4b1a-9e96-47d4f36bf819 was created by adora@example.com. "
+                "message": f"Template with id {TEMPLATE_ID} was created by adora@example.com. "
                 "Are you sure you want to delete? [y/N]: n",
             },
             "logging": "Okay, aborting delete operation",
         },
-        {
-            "args": ["template", "delete", "cd987859-06fe-4b1a-9e96-47d4f36bf819"],
-            "id": "cd987859-06fe-4b1a-9e96-47d4f36bf819",
-            "find_return": json.dumps(
-                {
-                    "title": "No template found",
-                    "status": 404,
-                    "detail": "No template found with the specified ID",
-                },
-                indent=4,
-                sort_keys=True,
-            ),
-            "email": "adora@example.com",
-            "return": json.dumps(
-                {
-                    "title": "No template found",
-                    "status": 404,
-                    "detail": "No template found with the specified ID",
-                },
-                indent=4,
-                sort_keys=True,
-            ),
-        },
-    ]
+    ],
+    ids=["confirmed", "aborted"],
 )
-def delete_data(request):
-    # We want to load the value from "email" from config
-    mockito.when(config).load_var("email").thenReturn(request.param["email"])
-    # Set all requests to return None so only the one we expect will return a value
-    mockito.when(templates).delete(...).thenReturn(None)
-    mockito.when(templates).find_by_id(...).thenReturn(None)
-    # If there's a value for from_name, set the return value for trying to retrieve the existing
-    # record
-    if "from_name" in request.param:
-        mockito.when(templates).find(
-            name=request.param["from_name"]["name"],
-            limit=2
-        ).thenReturn(request.param["from_name"]["return"])
-    # Mock up request response
-    mockito.when(templates).delete(request.param["id"]).thenReturn(
-        request.param["return"]
+def test_delete_interactive(delete_data, runner, caplog):
+    stub_delete(delete_data)
+    caplog.set_level(logging.INFO)
+    # Answer the confirmation prompt and expect it to be echoed before the response
+    result = runner.invoke(
+        carrot, delete_data["args"], input=delete_data["interactive"]["input"]
     )
-    mockito.when(templates).find_by_id(request.param["id"]).thenReturn(
-        request.param["find_return"]
+    assert result.output == (
+        delete_data["interactive"]["message"] + delete_data["return"] + "\n"
     )
-    return request.param
-
-
-def test_delete(delete_data, caplog):
-    caplog.set_level(logging.INFO)
-    runner = CliRunner()
-    # Include interactive input and expected message if this test should trigger interactive stuff
-    if "interactive" in delete_data:
-        expected_output = (
-            delete_data["interactive"]["message"] + delete_data["return"] + "\n"
-        )
-        result = runner.invoke(
-            carrot, delete_data["args"], input=delete_data["interactive"]["input"]
-        )
-        assert result.output == expected_output
-    else:
-        result = runner.invoke(carrot, delete_data["args"])
-        assert result.output == delete_data["return"] + "\n"
     # If we expect logging that we want to check, make sure it's there
     if "logging" in delete_data:
         assert delete_data["logging"] in caplog.text
 
 
-@pytest.fixture(
-    params=[
-        {
-            "args": [
-                "template",
-                "find_runs",
-                "cd987859-06fe-4b1a-9e96-47d4f36bf819",
-                "--run_group_id",
-                "ad487859-06fe-4b1a-9e96-47d4f36bf819",
-                "--name",
-                "Queen of Bright Moon run",
-                "--status",
-                "succeeded",
-                "--test_input",
-                "tests/data/mock_test_input.json",
-                "--test_options",
-                "tests/data/mock_test_options.json",
-                "--eval_input",
-                "tests/data/mock_eval_input.json",
-                "--eval_options",
-                "tests/data/mock_eval_options.json",
-                "--test_cromwell_job_id",
-                "d9855002-6b71-429c-a4de-8e90222488cd",
-                "--eval_cromwell_job_id",
-                "03958293-6b71-429c-a4de-8e90222488cd",
-                "--software_name",
-                "test_software",
-                "--commit_or_tag",
-                "1.1.0",
-                "--commit_or_tag",
-                "1.1.1",
-                "--created_before",
-                "2020-10-00T00:00:00.000000",
-                "--created_after",
-                "2020-09-00T00:00:00.000000",
-                "--created_by",
-                "glimmer@example.com",
-                "--finished_before",
-                "2020-10-00T00:00:00.000000",
-                "--finished_after",
-                "2020-09-00T00:00:00.000000",
-                "--sort",
-                "asc(name)",
-                "--limit",
-                1,
-                "--offset",
-                0,
-            ],
-            "params": [
-                "cd987859-06fe-4b1a-9e96-47d4f36bf819",
-                "ad487859-06fe-4b1a-9e96-47d4f36bf819",
-                "Queen of Bright Moon run",
-                "succeeded",
-                {"in_greeted": "Cool Person"},
-                {"option": "other_value"},
-                {"in_output_filename": "test_greeting.txt"},
-                {"option": "value"},
-                "d9855002-6b71-429c-a4de-8e90222488cd",
-                "03958293-6b71-429c-a4de-8e90222488cd",
-                {"name": "test_software", "commits_and_tags": ["1.1.0", "1.1.1"]},
-                "2020-10-00T00:00:00.000000",
-                "2020-09-00T00:00:00.000000",
-                "glimmer@example.com",
-                "2020-10-00T00:00:00.000000",
-                "2020-09-00T00:00:00.000000",
-                "asc(name)",
-                1,
-                0,
-                None
-            ],
-            "return": json.dumps(
-                [
-                    {
-                        "created_at": "2020-09-16T18:48:06.371563",
-                        "finished_at": "2020-09-16T18:58:06.371563",
-                        "created_by": "glimmer@example.com",
-                        "test_input": {"in_greeted": "Cool Person", "docker": "image_build:test_software|1.1.0"},
-                        "test_options": {"option": "other_value"},
-                        "eval_input": {"in_output_filename": "test_greeting.txt"},
-                        "eval_options": {"option": "value"},
-                        "status": "succeeded",
-                        "results": {},
-                        "run_group_id": "ad487859-06fe-4b1a-9e96-47d4f36bf819",
-                        "test_cromwell_job_id": "d9855002-6b71-429c-a4de-8e90222488cd",
-                        "eval_cromwell_job_id": "03958293-6b71-429c-a4de-8e90222488cd",
-                        "name": "Queen of Bright Moon run",
-                        "test_id": "3d1bfbab-d9ec-46c7-aa8e-9c1d1808f2b8",
-                        "run_id": "cd987859-06fe-4b1a-9e96-47d4f36bf819",
-                    }
-                ],
-                indent=4,
-                sort_keys=True,
+def stub_find_runs(find_runs_data):
+    """Mocks up the find_runs request for the find_runs_data case"""
+    # If there's a value for from_name, set the return value for trying to retrieve the existing
+    # record
+    stub_name_lookup(templates, find_runs_data.get("from_name"))
+    # Mock up request response, with any other request returning None
+    params = find_runs_data["params"]
+    mockito.when(runs).find(...).thenAnswer(
+        answer_for(
+            ("templates", *params[:-1]), find_runs_data["return"], csv=params[-1]
+        )
+    )
+
+
+def find_runs_case(template, software_args=(), software_versions=None, zip_csv=None):
+    """
+    Builds the args and params for a find_runs case that filters on every run field, where only
+    the template, the software version filter and zip_csv vary between cases
+    """
+    args = (
+        "template",
+        "find_runs",
+        template,
+        "--run_group_id",
+        "ad487859-06fe-4b1a-9e96-47d4f36bf819",
+        "--name",
+        "Queen of Bright Moon run",
+        "--status",
+        "succeeded",
+        "--test_input",
+        "tests/data/mock_test_input.json",
+        "--test_options",
+        "tests/data/mock_test_options.json",
+        "--eval_input",
+        "tests/data/mock_eval_input.json",
+        "--eval_options",
+        "tests/data/mock_eval_options.json",
+        "--test_cromwell_job_id",
+        "d9855002-6b71-429c-a4de-8e90222488cd",
+        "--eval_cromwell_job_id",
+        "03958293-6b71-429c-a4de-8e90222488cd",
+        *software_args,
+        "--created_before",
+        "2020-10-00T00:00:00.000000",
+        "--created_after",
+        "2020-09-00T00:00:00.000000",
+        "--created_by",
+        "glimmer@example.com",
+        "--finished_before",
+        "2020-10-00T00:00:00.000000",
+        "--finished_after",
+        "2020-09-00T00:00:00.000000",
+        "--sort",
+        "asc(name)",
+        "--limit",
+        1,
+        "--offset",
+        0,
+    )
+    if zip_csv is not None:
+        args += ("--zip_csv", zip_csv)
+    params = (
+        TEMPLATE_ID,
+        "ad487859-06fe-4b1a-9e96-47d4f36bf819",
+        "Queen of Bright Moon run",
+        "succeeded",
+        {"in_greeted": "Cool Person"},
+        {"option": "other_value"},
+        {"in_output_filename": "test_greeting.txt"},
+        {"option": "value"},
+        "d9855002-6b71-429c-a4de-8e90222488cd",
+        "03958293-6b71-429c-a4de-8e90222488cd",
+        software_versions,
+        "2020-10-00T00:00:00.000000",
+        "2020-09-00T00:00:00.000000",
+        "glimmer@example.com",
+        "2020-10-00T00:00:00.000000",
+        "2020-09-00T00:00:00.000000",
+        "asc(name)",
+        1,
+        0,
+        zip_csv,
+    )
+    return {"args": args, "params": params}
+
+
+@pytest.mark.parametrize(
+    "find_runs_data",
+    [
+        {
+            **find_runs_case(
+                TEMPLATE_ID,
+                software_args=(
+                    "--software_name",
+                    "test_software",
+                    "--commit_or_tag",
+                    "1.1.0",
+                    "--commit_or_tag",
+                    "1.1.1",
+                ),
+                software_versions={
+                    "name": "test_software",
+                    "commits_and_tags": ["1.1.0", "1.1.1"],
+                },
             ),
+            "return": FOUND_RUNS_JSON,
         },
         {
-            "args": [
-                "template",
-                "find_runs",
-                "cd987859-06fe-4b1a-9e96-47d4f36bf819",
-                "--run_group_id",
-                "ad487859-06fe-4b1a-9e96-47d4f36bf819",
-                "--name",
-                "Queen of Bright Moon run",
-                "--status",
-                "succeeded",
-                "--test_input",
-                "tests/data/mock_test_input.json",
-                "--test_options",
-                "tests/data/mock_test_options.json",
-                "--eval_input",
-                "tests/data/mock_eval_input.json",
-                "--eval_options",
-                "tests/data/mock_eval_options.json",
-                "--test_cromwell_job_id",
-                "d9855002-6b71-429c-a4de-8e90222488cd",
-                "--eval_cromwell_job_id",
-                "03958293-6b71-429c-a4de-8e90222488cd",
-                "--software_name",
-                "test_software",
-                "--commit_count",
-                1,
-                "--software_branch",
-                "master",
-                "--tags_only",
-                "--created_before",
-                "2020-10-00T00:00:00.000000",
-                "--created_after",
-                "2020-09-00T00:00:00.000000",
-                "--created_by",
-                "glimmer@example.com",
-                "--finished_before",
-                "2020-10-00T00:00:00.000000",
-                "--finished_after",
-                "2020-09-00T00:00:00.000000",
-                "--sort",
-                "asc(name)",
-                "--limit",
-                1,
-                "--offset",
-                0,
-            ],
-            "params": [
-                "cd987859-06fe-4b1a-9e96-47d4f36bf819",
-                "ad487859-06fe-4b1a-9e96-47d4f36bf819",
-                "Queen of Bright Moon run",
-                "succeeded",
-                {"in_greeted": "Cool Person"},
-                {"option": "other_value"},
-                {"in_output_filename": "test_greeting.txt"},
-                {"option": "value"},
-                "d9855002-6b71-429c-a4de-8e90222488cd",
-                "03958293-6b71-429c-a4de-8e90222488cd",
-                {"name": "test_software", "count": 1, "branch": "master", "tags_only": True},
-                "2020-10-00T00:00:00.000000",
-                "2020-09-00T00:00:00.000000",
-                "glimmer@example.com",
-                "2020-10-00T00:00:00.000000",
-                "2020-09-00T00:00:00.000000",
-                "asc(name)",
-                1,
-                0,
-                None
-            ],
-            "return": json.dumps(
-                [
-                    {
-                        "created_at": "2020-09-16T18:48:06.371563",
-                        "finished_at": "2020-09-16T18:58:06.371563",
-                        "created_by": "glimmer@example.com",
-                        "test_input": {"in_greeted": "Cool Person", "docker": "image_build:test_software|1.1.0"},
-                        "test_options": {"option": "other_value"},
-                        "eval_input": {"in_output_filename": "test_greeting.txt"},
-                        "eval_options": {"option": "value"},
-                        "status": "succeeded",
-                        "results": {},
-                        "run_group_id": "ad487859-06fe-4b1a-9e96-47d4f36bf819",
-                        "test_cromwell_job_id": "d9855002-6b71-429c-a4de-8e90222488cd",
-                        "eval_cromwell_job_id": "03958293-6b71-429c-a4de-8e90222488cd",
-                        "name": "Queen of Bright Moon run",
-                        "test_id": "3d1bfbab-d9ec-46c7-aa8e-9c1d1808f2b8",
-                        "run_id": "cd987859-06fe-4b1a-9e96-47d4f36bf819",
-                    }
-                ],
-                indent=4,
-                sort_keys=True,
+            **find_runs_case(
+                TEMPLATE_ID,
+                software_args=(
+                    "--software_name",
+                    "test_software",
+                    "--commit_count",
+                    1,
+                    "--software_branch",
+                    "master",
+                    "--tags_only",
+                ),
+                software_versions={
+                    "name": "test_software",
+                    "count": 1,
+                    "branch": "master",
+                    "tags_only": True,
+                },
             ),
+            "return": FOUND_RUNS_JSON,
         },
         {
-            "args": [
-                "template",
-                "find_runs",
-                "cd987859-06fe-4b1a-9e96-47d4f36bf819",
-                "--run_group_id",
-                "ad487859-06fe-4b1a-9e96-47d4f36bf819",
-                "--name",
-                "Queen of Bright Moon run",
-                "--status",
-                "succeeded",
-                "--test_input",
-                "tests/data/mock_test_input.json",
-                "--test_options",
-                "tests/data/mock_test_options.json",
-                "--eval_input",
-                "tests/data/mock_eval_input.json",
-                "--eval_options",
-                "tests/data/mock_eval_options.json",
-                "--test_cromwell_job_id",
-                "d9855002-6b71-429c-a4de-8e90222488cd",
-                "--eval_cromwell_job_id",
-                "03958293-6b71-429c-a4de-8e90222488cd",
-                "--created_before",
-                "2020-10-00T00:00:00.000000",
-                "--created_after",
-                "2020-09-00T00:00:00.000000",
-                "--created_by",
-                "glimmer@example.com",
-                "--finished_before",
-                "2020-10-00T00:00:00.000000",
-                "--finished_after",
-                "2020-09-00T00:00:00.000000",
-                "--sort",
-                "asc(name)",
-                "--limit",
-                1,
-                "--offset",
-                0,
-                "--zip_csv",
-                "csvs.zip"
-            ],
-            "params": [
-                "cd987859-06fe-4b1a-9e96-47d4f36bf819",
-                "ad487859-06fe-4b1a-9e96-47d4f36bf819",
-                "Queen of Bright Moon run",
-                "succeeded",
-                {"in_greeted": "Cool Person"},
-                {"option": "other_value"},
-                {"in_output_filename": "test_greeting.txt"},
-                {"option": "value"},
-                "d9855002-6b71-429c-a4de-8e90222488cd",
-                "03958293-6b71-429c-a4de-8e90222488cd",
-                None,
-                "2020-10-00T00:00:00.000000",
-                "2020-09-00T00:00:00.000000",
-                "glimmer@example.com",
-                "2020-10-00T00:00:00.000000",
-                "2020-09-00T00:00:00.000000",
-                "asc(name)",
-                1,
-                0,
-                "csvs.zip",
-            ],
-            "return": "Success!"
+            **find_runs_case(TEMPLATE_ID, zip_csv="csvs.zip"),
+            "return": "Success!",
         },
         {
-            "args": [
-                "template",
-                "find_runs",
-                "Sword of Protection template",
-                "--run_group_id",
-                "ad487859-06fe-4b1a-9e96-47d4f36bf819",
-                "--name",
-                "Queen of Bright Moon run",
-                "--status",
-                "succeeded",
-                "--test_input",
-                "tests/data/mock_test_input.json",
-                "--test_options",
-                "tests/data/mock_test_options.json",
-                "--eval_input",
-                "tests/data/mock_eval_input.json",
-                "--eval_options",
-                "tests/data/mock_eval_options.json",
-                "--test_cromwell_job_id",
-                "d9855002-6b71-429c-a4de-8e90222488cd",
-                "--eval_cromwell_job_id",
-                "03958293-6b71-429c-a4de-8e90222488cd",
-                "--created_before",
-                "2020-10-00T00:00:00.000000",
-                "--created_after",
-                "2020-09-00T00:00:00.000000",
-                "--created_by",
-                "glimmer@example.com",
-                "--finished_before",
-                "2020-10-00T00:00:00.000000",
-                "--finished_after",
-                "2020-09-00T00:00:00.000000",
-                "--sort",
-                "asc(name)",
-                "--limit",
-                1,
-                "--offset",
-                0,
-            ],
-            "params": [
-                "cd987859-06fe-4b1a-9e96-47d4f36bf819",
-                "ad487859-06fe-4b1a-9e96-47d4f36bf819",
-                "Queen of Bright Moon run",
-                "succeeded",
-                {"in_greeted": "Cool Person"},
-                {"option": "other_value"},
-                {"in_output_filename": "test_greeting.txt"},
-                {"option": "value"},
-                "d9855002-6b71-429c-a4de-8e90222488cd",
-                "03958293-6b71-429c-a4de-8e90222488cd",
-                None,
-                "2020-10-00T00:00:00.000000",
-                "2020-09-00T00:00:00.000000",
-                "glimmer@example.com",
-                "2020-10-00T00:00:00.000000",
-                "2020-09-00T00:00:00.000000",
-                "asc(name)",
-                1,
-                0,
-                None
-            ],
+            **find_runs_case("Sword of Protection template"),
             "from_name": {
                 "name": "Sword of Protection template",
-                "return": json.dumps(
-                    [
-                        {
-                            "created_at": "2020-09-16T18:48:06.371563",
-                            "created_by": "adora@example.com",
-                            "description": "This template replaced the broken one",
-                            "test_wdl": "example.com/she-ra_test.wdl",
-                            "eval_wdl": "example.com/she-ra_eval.wdl",
-                            "name": "New Sword of Protection template",
-                            "pipeline_id": "4d1bfbab-d9ec-46c7-aa8e-9c1d1808f2b8",
-                            "template_id": "cd987859-06fe-4b1a-9e96-47d4f36bf819",
-                        }
-                    ],
-                    indent=4,
-                    sort_keys=True,
-                )
+                "return": NEW_TEMPLATES_JSON,
             },
             "return": json.dumps(
                 [
@@ -1251,8 +1163,8 @@ def test_delete(delete_data, caplog):
             ),
         },
         {
-            "args": ["template", "find_runs", "986325ba-06fe-4b1a-9e96-47d4f36bf819"],
-            "params": [
+            "args": ("template", "find_runs", "986325ba-06fe-4b1a-9e96-47d4f36bf819"),
+            "params": (
                 "986325ba-06fe-4b1a-9e96-47d4f36bf819",
                 None,
                 None,
@@ -1273,343 +1185,174 @@ def test_delete(delete_data, caplog):
                 20,
                 0,
                 None,
-            ],
-            "return": json.dumps(
-                {
-                    "title": "No run found",
-                    "status": 404,
-                    "detail": "No runs found with the specified parameters",
-                },
-                indent=4,
-                sort_keys=True,
             ),
+            "return": NO_RUNS_FOUND_JSON,
         },
-        {
-            "args": [
-                "template",
-                "find_runs",
-                "986325ba-06fe-4b1a-9e96-47d4f36bf819",
-                "--test_input",
-                "nonexistent_file.json",
-            ],
-            "params": [],
-            "logging": "Encountered FileNotFound error when trying to read nonexistent_file.json",
-        },
-    ]
+    ],
+    ids=["commits_and_tags", "commit_count", "zip_csv", "from_name", "not_found"],
 )
-def find_runs_data(request):
-    # Set all requests to return None so only the one we expect will return a value
-    mockito.when(runs).find(...).thenReturn(None)
-    # If there's a value for from_name, set the return value for trying to retrieve the existing
-    # record
-    if "from_name" in request.param:
-        mockito.when(templates).find(
-            name=request.param["from_name"]["name"],
-            limit=2
-        ).thenReturn(request.param["from_name"]["return"])
-    # Mock up request response
-    if len(request.param["params"]) > 0:
-        mockito.when(runs).find(
-            "templates",
-            request.param["params"][0],
-            request.param["params"][1],
-            request.param["params"][2],
-            request.param["params"][3],
-            request.param["params"][4],
-            request.param["params"][5],
-            request.param["params"][6],
-            request.param["params"][7],
-            request.param["params"][8],
-            request.param["params"][9],
-            request.param["params"][10],
-            request.param["params"][11],
-            request.param["params"][12],
-            request.param["params"][13],
-            request.param["params"][14],
-            request.param["params"][15],
-            request.param["params"][16],
-            request.param["params"][17],
-            request.param["params"][18],
-            csv=request.param["params"][19],
-        ).thenReturn(request.param["return"])
-    return request.param
+def test_find_runs(find_runs_data, runner):
+    stub_find_runs(find_runs_data)
+    result = runner.invoke(carrot, find_runs_data["args"])
+    assert result.output == find_runs_data["return"] + "\n"
 
 
-def test_find_runs(find_runs_data, caplog):
-    runner = CliRunner()
-    result = runner.invoke(carrot, find_runs_data["args"])
-    if "logging" in find_runs_data:
-        assert find_runs_data["logging"] in caplog.text
-    else:
-        assert result.output == find_runs_data["return"] + "\n"
+def test_find_runs_missing_file(runner, caplog):
+    args = (
+        "template",
+        "find_runs",
+        "986325ba-06fe-4b1a-9e96-47d4f36bf819",
+        "--test_input",
+        "nonexistent_file.json",
+    )
+    runner.invoke(carrot, args)
+    assert (
+        "Encountered FileNotFound error when trying to read nonexistent_file.json"
+    ) in caplog.text
+
+
+def stub_create_report_for_runs(create_report_for_runs_data):
+    """Mocks up the create_map_from_run_query request for the create_report_for_runs_data case"""
+    # If there are values for from_name or report_from_name, set the return values for trying to
+    # retrieve the existing records
+    stub_name_lookup(templates, create_report_for_runs_data.get("from_name"))
+    stub_name_lookup(reports, create_report_for_runs_data.get("report_from_name"))
+    # Mock up request response, with any other request returning None
+    mockito.when(report_maps).create_map_from_run_query(...).thenAnswer(
+        answer_for(
+            create_report_for_runs_data["params"], create_report_for_runs_data["return"]
+        )
+    )
 
 
-@pytest.fixture(
-    params=[
-        {
-            "args": [
-                "template",
-                "create_report_for_runs",
-                "cd987859-06fe-4b1a-9e96-47d4f36bf819",
-                "dd1b6094-b43a-4d98-8873-cc9b38e8b85d",
-                "--created_by",
-                "adora@example.com",
-                "--run_group_id",
-                "ad487859-06fe-4b1a-9e96-47d4f36bf819",
-                "--name",
-                "Queen of Bright Moon run",
-                "--status",
-                "succeeded",
-                "--test_input",
-                "tests/data/mock_test_input.json",
-                "--test_options",
-                "tests/data/mock_test_options.json",
-                "--eval_input",
-                "tests/data/mock_eval_input.json",
-                "--eval_options",
-                "tests/data/mock_eval_options.json",
-                "--test_cromwell_job_id",
-                "d9855002-6b71-429c-a4de-8e90222488cd",
-                "--eval_cromwell_job_id",
-                "03958293-6b71-429c-a4de-8e90222488cd",
-                "--software_name",
-                "test_software",
-                "--commit_or_tag",
-                "1.1.0",
-                "--commit_or_tag",
-                "1.1.1",
-                "--created_before",
-                "2020-10-00T00:00:00.000000",
-                "--created_after",
-                "2020-09-00T00:00:00.000000",
-                "--run_created_by",
-                "glimmer@example.com",
-                "--finished_before",
-                "2020-10-00T00:00:00.000000",
-                "--finished_after",
-                "2020-09-00T00:00:00.000000",
-                "--sort",
-                "asc(name)",
-                "--limit",
-                1,
-                "--offset",
-                0,
-            ],
-            "params": [
-                "dd1b6094-b43a-4d98-8873-cc9b38e8b85d",
-                "adora@example.com",
-                "templates",
-                "cd987859-06fe-4b1a-9e96-47d4f36bf819",
-                "ad487859-06fe-4b1a-9e96-47d4f36bf819",
-                "Queen of Bright Moon run",
-                "succeeded",
-                {"in_greeted": "Cool Person"},
-                {"option": "other_value"},
-                {"in_output_filename": "test_greeting.txt"},
-                {"option": "value"},
-                "d9855002-6b71-429c-a4de-8e90222488cd",
-                "03958293-6b71-429c-a4de-8e90222488cd",
-                {"name": "test_software", "commits_and_tags": ["1.1.0", "1.1.1"]},
-                "2020-10-00T00:00:00.000000",
-                "2020-09-00T00:00:00.000000",
-                "glimmer@example.com",
-                "2020-10-00T00:00:00.000000",
-                "2020-09-00T00:00:00.000000",
-                "asc(name)",
-                1,
-                0
-            ],
-            "return": json.dumps(
-                {
-                    "entity_id": "128abc85-06fe-4b1a-9e96-47d4f36bf819",
-                    "entity_type": "run_group",
-                    "report_id": "dd1b6094-b43a-4d98-8873-cc9b38e8b85d",
-                    "status": "created",
-                    "results": {},
-                    "cromwell_job_id": "8f1bfbab-d9ec-46c7-aa8e-9c1d1808f2b8",
-                    "created_at": "2020-09-24T19:07:59.311462",
-                    "created_by": "adora@example.com",
-                    "finished_at": None,
+def create_report_for_runs_case(
+    template, report, software_args=(), software_versions=None
+):
+    """
+    Builds the args and params for a create_report_for_runs case that filters on every run field,
+    where only the template, the report and the software version filter vary between cases
+    """
+    args = (
+        "template",
+        "create_report_for_runs",
+        template,
+        report,
+        "--created_by",
+        "adora@example.com",
+        "--run_group_id",
+        "ad487859-06fe-4b1a-9e96-47d4f36bf819",
+        "--name",
+        "Queen of Bright Moon run",
+        "--status",
+        "succeeded",
+        "--test_input",
+        "tests/data/mock_test_input.json",
+        "--test_options",
+        "tests/data/mock_test_options.json",
+        "--eval_input",
+        "tests/data/mock_eval_input.json",
+        "--eval_options",
+        "tests/data/mock_eval_options.json",
+        "--test_cromwell_job_id",
+        "d9855002-6b71-429c-a4de-8e90222488cd",
+        "--eval_cromwell_job_id",
+        "03958293-6b71-429c-a4de-8e90222488cd",
+        *software_args,
+        "--created_before",
+        "2020-10-00T00:00:00.000000",
+        "--created_after",
+        "2020-09-00T00:00:00.000000",
+        "--run_created_by",
+        "glimmer@example.com",
+        "--finished_before",
+        "2020-10-00T00:00:00.000000",
+        "--finished_after",
+        "2020-09-00T00:00:00.000000",
+        "--sort",
+        "asc(name)",
+        "--limit",
+        1,
+        "--offset",
+        0,
+    )
+    params = (
+        REPORT_ID,
+        "adora@example.com",
+        "templates",
+        TEMPLATE_ID,
+        "ad487859-06fe-4b1a-9e96-47d4f36bf819",
+        "Queen of Bright Moon run",
+        "succeeded",
+        {"in_greeted": "Cool Person"},
+        {"option": "other_value"},
+        {"in_output_filename": "test_greeting.txt"},
+        {"option": "value"},
+        "d9855002-6b71-429c-a4de-8e90222488cd",
+        "03958293-6b71-429c-a4de-8e90222488cd",
+        software_versions,
+        "2020-10-00T00:00:00.000000",
+        "2020-09-00T00:00:00.000000",
+        "glimmer@example.com",
+        "2020-10-00T00:00:00.000000",
+        "2020-09-00T00:00:00.000000",
+        "asc(name)",
+        1,
+        0,
+    )
+    return {"args": args, "params": params}
+
+
+@pytest.mark.parametrize(
+    "create_report_for_runs_data",
+    [
+        {
+            **create_report_for_runs_case(
+                TEMPLATE_ID,
+                REPORT_ID,
+                software_args=(
+                    "--software_name",
+                    "test_software",
+                    "--commit_or_tag",
+                    "1.1.0",
+                    "--commit_or_tag",
+                    "1.1.1",
+                ),
+                software_versions={
+                    "name": "test_software",
+                    "commits_and_tags": ["1.1.0", "1.1.1"],
                 },
-                indent=4,
-                sort_keys=True,
             ),
+            "return": RUN_GROUP_REPORT_MAP_JSON,
         },
         {
-            "args": [
-                "template",
-                "create_report_for_runs",
-                "cd987859-06fe-4b1a-9e96-47d4f36bf819",
-                "dd1b6094-b43a-4d98-8873-cc9b38e8b85d",
-                "--created_by",
-                "adora@example.com",
-                "--run_group_id",
-                "ad487859-06fe-4b1a-9e96-47d4f36bf819",
-                "--name",
-                "Queen of Bright Moon run",
-                "--status",
-                "succeeded",
-                "--test_input",
-                "tests/data/mock_test_input.json",
-                "--test_options",
-                "tests/data/mock_test_options.json",
-                "--eval_input",
-                "tests/data/mock_eval_input.json",
-                "--eval_options",
-                "tests/data/mock_eval_options.json",
-                "--test_cromwell_job_id",
-                "d9855002-6b71-429c-a4de-8e90222488cd",
-                "--eval_cromwell_job_id",
-                "03958293-6b71-429c-a4de-8e90222488cd",
-                "--software_name",
-                "test_software",
-                "--commit_count",
-                1,
-                "--software_branch",
-                "master",
-                "--tags_only",
-                "--created_before",
-                "2020-10-00T00:00:00.000000",
-                "--created_after",
-                "2020-09-00T00:00:00.000000",
-                "--run_created_by",
-                "glimmer@example.com",
-                "--finished_before",
-                "2020-10-00T00:00:00.000000",
-                "--finished_after",
-                "2020-09-00T00:00:00.000000",
-                "--sort",
-                "asc(name)",
-                "--limit",
-                1,
-                "--offset",
-                0,
-            ],
-            "params": [
-                "dd1b6094-b43a-4d98-8873-cc9b38e8b85d",
-                "adora@example.com",
-                "templates",
-                "cd987859-06fe-4b1a-9e96-47d4f36bf819",
-                "ad487859-06fe-4b1a-9e96-47d4f36bf819",
-                "Queen of Bright Moon run",
-                "succeeded",
-                {"in_greeted": "Cool Person"},
-                {"option": "other_value"},
-                {"in_output_filename": "test_greeting.txt"},
-                {"option": "value"},
-                "d9855002-6b71-429c-a4de-8e90222488cd",
-                "03958293-6b71-429c-a4de-8e90222488cd",
-                {"name": "test_software", "count": 1, "branch": "master", "tags_only": True},
-                "2020-10-00T00:00:00.000000",
-                "2020-09-00T00:00:00.000000",
-                "glimmer@example.com",
-                "2020-10-00T00:00:00.000000",
-                "2020-09-00T00:00:00.000000",
-                "asc(name)",
-                1,
-                0
-            ],
-            "return": json.dumps(
-                {
-                    "entity_id": "128abc85-06fe-4b1a-9e96-47d4f36bf819",
-                    "entity_type": "run_group",
-                    "report_id": "dd1b6094-b43a-4d98-8873-cc9b38e8b85d",
-                    "status": "created",
-                    "results": {},
-                    "cromwell_job_id": "8f1bfbab-d9ec-46c7-aa8e-9c1d1808f2b8",
-                    "created_at": "2020-09-24T19:07:59.311462",
-                    "created_by": "adora@example.com",
-                    "finished_at": None,
+            **create_report_for_runs_case(
+                TEMPLATE_ID,
+                REPORT_ID,
+                software_args=(
+                    "--software_name",
+                    "test_software",
+                    "--commit_count",
+                    1,
+                    "--software_branch",
+                    "master",
+                    "--tags_only",
+                ),
+                software_versions={
+                    "name": "test_software",
+                    "count": 1,
+                    "branch": "master",
+                    "tags_only": True,
                 },
-                indent=4,
-                sort_keys=True,
             ),
+            "return": RUN_GROUP_REPORT_MAP_JSON,
         },
         {
-            "args": [
-                "template",
-                "create_report_for_runs",
-                "Sword of Protection template",
-                "Sword of Protection report",
-                "--created_by",
-                "adora@example.com",
-                "--run_group_id",
-                "ad487859-06fe-4b1a-9e96-47d4f36bf819",
-                "--name",
-                "Queen of Bright Moon run",
-                "--status",
-                "succeeded",
-                "--test_input",
-                "tests/data/mock_test_input.json",
-                "--test_options",
-                "tests/data/mock_test_options.json",
-                "--eval_input",
-                "tests/data/mock_eval_input.json",
-                "--eval_options",
-                "tests/data/mock_eval_options.json",
-                "--test_cromwell_job_id",
-                "d9855002-6b71-429c-a4de-8e90222488cd",
-                "--eval_cromwell_job_id",
-                "03958293-6b71-429c-a4de-8e90222488cd",
-                "--created_before",
-                "2020-10-00T00:00:00.000000",
-                "--created_after",
-                "2020-09-00T00:00:00.000000",
-                "--run_created_by",
-                "glimmer@example.com",
-                "--finished_before",
-                "2020-10-00T00:00:00.000000",
-                "--finished_after",
-                "2020-09-00T00:00:00.000000",
-                "--sort",
-                "asc(name)",
-                "--limit",
-                1,
-                "--offset",
-                0,
-            ],
-            "params": [
-                "dd1b6094-b43a-4d98-8873-cc9b38e8b85d",
-                "adora@example.com",
-                "templates",
-                "cd987859-06fe-4b1a-9e96-47d4f36bf819",
-                "ad487859-06fe-4b1a-9e96-47d4f36bf819",
-                "Queen of Bright Moon run",
-                "succeeded",
-                {"in_greeted": "Cool Person"},
-                {"option": "other_value"},
-                {"in_output_filename": "test_greeting.txt"},
-                {"option": "value"},
-                "d9855002-6b71-429c-a4de-8e90222488cd",
-                "03958293-6b71-429c-a4de-8e90222488cd",
-                None,
-                "2020-10-00T00:00:00.000000",
-                "2020-09-00T00:00:00.000000",
-                "glimmer@example.com",
-                "2020-10-00T00:00:00.000000",
-                "2020-09-00T00:00:00.000000",
-                "asc(name)",
-                1,
-                0
-            ],
+            **create_report_for_runs_case(
+                "Sword of Protection template", "Sword of Protection report"
+            ),
             "from_name": {
                 "name": "Sword of Protection template",
-                "return": json.dumps(
-                    [
-                        {
-                            "created_at": "2020-09-16T18:48:06.371563",
-                            "created_by": "adora@example.com",
-                            "description": "This template replaced the broken one",
-                            "test_wdl": "example.com/she-ra_test.wdl",
-                            "eval_wdl": "example.com/she-ra_eval.wdl",
-                            "name": "New Sword of Protection template",
-                            "pipeline_id": "4d1bfbab-d9ec-46c7-aa8e-9c1d1808f2b8",
-                            "template_id": "cd987859-06fe-4b1a-9e96-47d4f36bf819",
-                        }
-                    ],
-                    indent=4,
-                    sort_keys=True,
-                )
+                "return": NEW_TEMPLATES_JSON,
             },
             "report_from_name": {
                 "name": "Sword of Protection report",
@@ -1621,94 +1364,27 @@ def test_find_runs(find_runs_data, caplog):
                             "created_by": "adora@example.com",
                             "description": "This new report replaced the broken one",
                             "name": "Sword of Protection report",
-                            "notebook": {
-                                "metadata": {
-                                    "language_info": {
-                                        "codemirror_mode": {"name": "ipython", "version": 3},
-                                        "file_extension": ".py",
-                                        "mimetype": "text/x-python",
-                                        "name": "python",
-                                        "nbconvert_exporter": "python",
-                                        "pygments_lexer": "ipython3",
-                                        "version": "3.8.5-final",
-                                    },
-                                    "orig_nbformat": 2,
-                                    "kernelspec": {
-                                        "name": "python3",
-                                        "display_name": "Python 3.8.5 64-bit",
-                                        "metadata": {
-                                            "interpreter": {
-                                                "hash": "1ee38ef4a5a9feb55287fd749643f13d043cb0a7addaab2a9c224cbe137c0062"
-                                            }
-                                        },
-                                    },
-                                },
-                                "nbformat": 4,
-                                "nbformat_minor": 2,
-                                "cells": [
-                                    {
-                                        "cell_type": "code",
-                                        "execution_count": None,
-                                        "metadata": {},
-                                        "outputs": [],
-                                        "source": [
-                                            'message = carrot_run_data["results"]["Greeting"]\n',
-                                            "print(message)",
-                                        ],
-                                    },
-                                    {
-                                        "cell_type": "code",
-                                        "execution_count": None,
-                                        "metadata": {},
-                                        "outputs": [],
-                                        "source": [
-                                            'message_file = open(carrot_downloads["results"]["File Result"], \'r\')\n',
-                                            "print(message_file.read())",
-                                        ],
-                                    },
-                                    {
-                                        "cell_type": "code",
-                                        "execution_count": None,
-                                        "metadata": {},
-                                        "outputs": [],
-                                        "source": ["print('Thanks')"],
-                                    },
-                                ],
-                            },
-                            "report_id": "dd1b6094-b43a-4d98-8873-cc9b38e8b85d",
+                            "notebook": NOTEBOOK,
+                            "report_id": REPORT_ID,
                         }
                     ],
                     indent=4,
                     sort_keys=True,
                 ),
             },
-            "return": json.dumps(
-                {
-                    "entity_id": "128abc85-06fe-4b1a-9e96-47d4f36bf819",
-                    "entity_type": "run_group",
-                    "report_id": "dd1b6094-b43a-4d98-8873-cc9b38e8b85d",
-                    "status": "created",
-                    "results": {},
-                    "cromwell_job_id": "8f1bfbab-d9ec-46c7-aa8e-9c1d1808f2b8",
-                    "created_at": "2020-09-24T19:07:59.311462",
-                    "created_by": "adora@example.com",
-                    "finished_at": None,
-                },
-                indent=4,
-                sort_keys=True,
-            ),
+            "return": RUN_GROUP_REPORT_MAP_JSON,
         },
         {
             "args": [
                 "template",
                 "create_report_for_runs",
                 "986325ba-06fe-4b1a-9e96-47d4f36bf819",
-                "dd1b6094-b43a-4d98-8873-cc9b38e8b85d",
+                REPORT_ID,
                 "--created_by",
-                "adora@example.com"
+                "adora@example.com",
             ],
             "params": [
-                "dd1b6094-b43a-4d98-8873-cc9b38e8b85d",
+                REPORT_ID,
                 "adora@example.com",
                 "templates",
                 "986325ba-06fe-4b1a-9e96-47d4f36bf819",
@@ -1729,85 +1405,49 @@ def test_find_runs(find_runs_data, caplog):
                 None,
                 None,
                 20,
-                0
-            ],
-            "return": json.dumps(
-                {
-                    "title": "No run found",
-                    "status": 404,
-                    "detail": "No runs found with the specified parameters",
-                },
-                indent=4,
-                sort_keys=True,
-            ),
-        },
-        {
-            "args": [
-                "template",
-                "create_report_for_runs",
-                "986325ba-06fe-4b1a-9e96-47d4f36bf819",
-                "dd1b6094-b43a-4d98-8873-cc9b38e8b85d",
-                "--created_by",
-                "adora@example.com",
-                "--test_input",
-                "nonexistent_file.json",
+                0,
             ],
-            "params": [],
-            "logging": "Encountered FileNotFound error when trying to read nonexistent_file.json",
+            "return": NO_RUNS_FOUND_JSON,
         },
-    ]
+    ],
+    ids=["commits_and_tags", "commit_count", "from_name", "not_found"],
 )
-def create_report_for_runs_data(request):
-    # Set all requests to return None so only the one we expect will return a value
-    mockito.when(report_maps).create_map_from_run_query(...).thenReturn(None)
-    # If there's a value for from_name, set the return value for trying to retrieve the existing
-    # record
-    if "from_name" in request.param:
-        mockito.when(templates).find(
-            name=request.param["from_name"]["name"],
-            limit=2
-        ).thenReturn(request.param["from_name"]["return"])
-    if "report_from_name" in request.param:
-        mockito.when(reports).find(
-            name=request.param["report_from_name"]["name"],
-            limit=2
-        ).thenReturn(request.param["report_from_name"]["return"])
-    # Mock up request response
-    if len(request.param["params"]) > 0:
-        mockito.when(report_maps).create_map_from_run_query(
-            request.param["params"][0],
-            request.param["params"][1],
-            request.param["params"][2],
-            request.param["params"][3],
-            request.param["params"][4],
-            request.param["params"][5],
-            request.param["params"][6],
-            request.param["params"][7],
-            request.param["params"][8],
-            request.param["params"][9],
-            request.param["params"][10],
-            request.param["params"][11],
-            request.param["params"][12],
-            request.param["params"][13],
-            request.param["params"][14],
-            request.param["params"][15],
-            request.param["params"][16],
-            request.param["params"][17],
-            request.param["params"][18],
-            request.param["params"][19],
-            request.param["params"][20],
-            request.param["params"][21],
-        ).thenReturn(request.param["return"])
-    return request.param
+def test_create_report_for_runs(create_report_for_runs_data, runner):
+    stub_create_report_for_runs(create_report_for_runs_data)
+    result = runner.invoke(carrot, create_report_for_runs_data["args"])
+    assert result.output == create_report_for_runs_data["return"] + "\n"
+
+
+def test_create_report_for_runs_missing_file(runner, caplog):
+    args = (
+        "template",
+        "create_report_for_runs",
+        "986325ba-06fe-4b1a-9e96-47d4f36bf819",
+        REPORT_ID,
+        "--created_by",
+        "adora@example.com",
+        "--test_input",
+        "nonexistent_file.json",
+    )
+    runner.invoke(carrot, args)
+    assert (
+        "Encountered FileNotFound error when trying to read nonexistent_file.json"
+    ) in caplog.text
 
 
-def test_create_report_for_runs(create_report_for_runs_data, caplog):
-    runner = CliRunner()
-    result = runner.invoke(carrot, create_report_for_runs_data["args"])
-    if "logging" in create_report_for_runs_data:
-        assert create_report_for_runs_data["logging"] in caplog.text
-    else:
-        assert result.output == create_report_for_runs_data["return"] + "\n"
+def stub_subscription(method, subscription_data):
+    """
+    Mocks up the subscribe or unsubscribe request (named by method), the email config variable and
+    the template name lookup for the subscription_data case
+    """
+    mockito.when(config).load_var_no_error("email").thenReturn("frosta@example.com")
+    # If there's a value for from_name, set the return value for trying to retrieve the existing
+    # record
+    stub_name_lookup(templates, subscription_data.get("from_name"))
+    # Mock up request response, returning None for any other call
+    getattr(mockito.when(templates), method)(...).thenAnswer(
+        answer_for(subscription_data["params"], subscription_data["return"])
+    )
 
 
 @pytest.fixture(
@@ -1816,22 +1456,12 @@ def test_create_report_for_runs(create_report_for_runs_data, caplog):
             "args": [
                 "template",
                 "subscribe",
-                "cd987859-06fe-4b1a-9e96-47d4f36bf819",
+                TEMPLATE_ID,
                 "--email",
                 "netossa@example.com",
             ],
-            "params": ["cd987859-06fe-4b1a-9e96-47d4f36bf819", "netossa@example.com"],
-            "return": json.dumps(
-                {
-                    "subscription_id": "361b3b95-4a6e-40d9-bd98-f92b2959864e",
-                    "entity_type": "template",
-                    "entity_id": "cd987859-06fe-4b1a-9e96-47d4f36bf819",
-                    "email": "netossa@example.com",
-                    "created_at": "2020-09-23T19:41:46.839880",
-                },
-                indent=4,
-                sort_keys=True,
-            ),
+            "params": [TEMPLATE_ID, "netossa@example.com"],
+            "return": NETOSSA_SUBSCRIPTION_JSON,
         },
         {
             "args": [
@@ -1841,37 +1471,12 @@ def test_create_report_for_runs(create_report_for_runs_data, caplog):
                 "--email",
                 "netossa@example.com",
             ],
-            "params": ["cd987859-06fe-4b1a-9e96-47d4f36bf819", "netossa@example.com"],
+            "params": [TEMPLATE_ID, "netossa@example.com"],
             "from_name": {
                 "name": "Sword of Protection template",
-                "return": json.dumps(
-                    [
-                        {
-                            "created_at": "2020-09-16T18:48:06.371563",
-                            "created_by": "adora@example.com",
-                            "description": "This template replaced the broken one",
-                            "test_wdl": "example.com/she-ra_test.wdl",
-                            "eval_wdl": "example.com/she-ra_eval.wdl",
-                            "name": "New Sword of Protection template",
-                            "pipeline_id": "4d1bfbab-d9ec-46c7-aa8e-9c1d1808f2b8",
-                            "template_id": "cd987859-06fe-4b1a-9e96-47d4f36bf819",
-                        }
-                    ],
-                    indent=4,
-                    sort_keys=True,
-                )
+                "return": NEW_TEMPLATES_JSON
             },
-            "return": json.dumps(
-                {
-                    "subscription_id": "361b3b95-4a6e-40d9-bd98-f92b2959864e",
-                    "entity_type": "template",
-                    "entity_id": "cd987859-06fe-4b1a-9e96-47d4f36bf819",
-                    "email": "netossa@example.com",
-                    "created_at": "2020-09-23T19:41:46.839880",
-                },
-                indent=4,
-                sort_keys=True,
-            ),
+            "return": NETOSSA_SUBSCRIPTION_JSON,
         },
         {
             "args": [
@@ -1885,15 +1490,7 @@ def test_create_report_for_runs(create_report_for_runs_data, caplog):
                 "89657859-06fe-4b1a-9e96-47d4f36bf819",
                 "spinnerella@example.com",
             ],
-            "return": json.dumps(
-                {
-                    "title": "No template found",
-                    "status": 404,
-                    "detail": "No template found with the specified ID",
-                },
-                indent=4,
-                sort_keys=True,
-            ),
+            "return": NO_TEMPLATE_FOUND_JSON,
         },
         {
             "args": ["template", "subscribe", "89657859-06fe-4b1a-9e96-47d4f36bf819"],
@@ -1902,7 +1499,7 @@ def test_create_report_for_runs(create_report_for_runs_data, caplog):
                 {
                     "subscription_id": "361b3b95-4a6e-40d9-bd98-f92b2959864e",
                     "entity_type": "template",
-                    "entity_id": "cd987859-06fe-4b1a-9e96-47d4f36bf819",
+                    "entity_id": TEMPLATE_ID,
                     "email": "frosta@example.com",
                     "created_at": "2020-09-23T19:41:46.839880",
                 },
@@ -1910,28 +1507,15 @@ def test_create_report_for_runs(create_report_for_runs_data, caplog):
                 sort_keys=True,
             ),
         },
-    ]
+    ],
+    ids=["by_id", "by_name", "not_found", "config_email"],
 )
 def subscribe_data(request):
-    # Set all requests to return None so only the one we expect will return a value
-    mockito.when(templates).subscribe(...).thenReturn(None)
-    mockito.when(config).load_var_no_error("email").thenReturn("frosta@example.com")
-    # If there's a value for from_name, set the return value for trying to retrieve the existing
-    # record
-    if "from_name" in request.param:
-        mockito.when(templates).find(
-            name=request.param["from_name"]["name"],
-            limit=2
-        ).thenReturn(request.param["from_name"]["return"])
-    # Mock up request response
-    mockito.when(templates).subscribe(
-        request.param["params"][0], request.param["params"][1]
-    ).thenReturn(request.param["return"])
+    stub_subscription("subscribe", request.param)
     return request.param
 
 
-def test_subscribe(subscribe_data):
-    runner = CliRunner()
+def test_subscribe(subscribe_data, runner):
     result = runner.invoke(carrot, subscribe_data["args"])
     assert result.output == subscribe_data["return"] + "\n"
 
@@ -1942,14 +1526,12 @@ def test_subscribe(subscribe_data):
             "args": [
                 "template",
                 "unsubscribe",
-                "cd987859-06fe-4b1a-9e96-47d4f36bf819",
+                TEMPLATE_ID,
                 "--email",
                 "netossa@example.com",
             ],
-            "params": ["cd987859-06fe-4b1a-9e96-47d4f36bf819", "netossa@example.com"],
-            "return": json.dumps(
-                {"message": "Successfully deleted 1 row(s)"}, indent=4, sort_keys=True
-            ),
+            "params": [TEMPLATE_ID, "netossa@example.com"],
+            "return": UNSUBSCRIBED_JSON,
         },
         {
             "args": [
@@ -1959,29 +1541,12 @@ def test_subscribe(subscribe_data):
                 "--email",
                 "netossa@example.com",
             ],
-            "params": ["cd987859-06fe-4b1a-9e96-47d4f36bf819", "netossa@example.com"],
+            "params": [TEMPLATE_ID, "netossa@example.com"],
             "from_name": {
                 "name": "Sword of Protection template",
-                "return": json.dumps(
-                    [
-                        {
-                            "created_at": "2020-09-16T18:48:06.371563",
-                            "created_by": "adora@example.com",
-                            "description": "This template replaced the broken one",
-                            "test_wdl": "example.com/she-ra_test.wdl",
-                            "eval_wdl": "example.com/she-ra_eval.wdl",
-                            "name": "New Sword of Protection template",
-                            "pipeline_id": "4d1bfbab-d9ec-46c7-aa8e-9c1d1808f2b8",
-                            "template_id": "cd987859-06fe-4b1a-9e96-47d4f36bf819",
-                        }
-                    ],
-                    indent=4,
-                    sort_keys=True,
-                )
+                "return": NEW_TEMPLATES_JSON
             },
-            "return": json.dumps(
-                {"message": "Successfully deleted 1 row(s)"}, indent=4, sort_keys=True
-            ),
+            "return": UNSUBSCRIBED_JSON,
         },
         {
             "args": [
@@ -2008,32 +1573,17 @@ def test_subscribe(subscribe_data):
         {
             "args": ["template", "unsubscribe", "89657859-06fe-4b1a-9e96-47d4f36bf819"],
             "params": ["89657859-06fe-4b1a-9e96-47d4f36bf819", "frosta@example.com"],
-            "return": json.dumps(
-                {"message": "Successfully deleted 1 row(s)"}, indent=4, sort_keys=True
-            ),
+            "return": UNSUBSCRIBED_JSON,
         },
-    ]
+    ],
+    ids=["by_id", "by_name", "not_found", "config_email"],
 )
 def unsubscribe_data(request):
-    # Set all requests to return None so only the one we expect will return a value
-    mockito.when(templates).unsubscribe(...).thenReturn(None)
-    mockito.when(config).load_var_no_error("email").thenReturn("frosta@example.com")
-    # If there's a value for from_name, set the return value for trying to retrieve the existing
-    # record
-    if "from_name" in request.param:
-        mockito.when(templates).find(
-            name=request.param["from_name"]["name"],
-            limit=2
-        ).thenReturn(request.param["from_name"]["return"])
-    # Mock up request response
-    mockito.when(templates).unsubscribe(
-        request.param["params"][0], request.param["params"][1]
-    ).thenReturn(request.param["return"])
+    stub_subscription("unsubscribe", request.param)
     return request.param
 
 
-def test_unsubscribe(unsubscribe_data):
-    runner = CliRunner()
+def test_unsubscribe(unsubscribe_data, runner):
     result = runner.invoke(carrot, unsubscribe_data["args"])
     assert result.output == unsubscribe_data["return"] + "\n"
 
@@ -2044,29 +1594,19 @@ def test_unsubscribe(unsubscribe_data):
             "args": [
                 "template",
                 "map_to_result",
-                "cd987859-06fe-4b1a-9e96-47d4f36bf819",
+                TEMPLATE_ID,
                 "3d1bfbab-d9ec-46c7-aa8e-9c1d1808f2b8",
                 "out_horde_tanks",
                 "--created_by",
                 "adora@example.com",
             ],
             "params": [
-                "cd987859-06fe-4b1a-9e96-47d4f36bf819",
+                TEMPLATE_ID,
                 "3d1bfbab-d9ec-46c7-aa8e-9c1d1808f2b8",
                 "out_horde_tanks",
                 "adora@example.com",
             ],
-            "return": json.dumps(
-                {
-                    "template_id": "cd987859-06fe-4b1a-9e96-47d4f36bf819",
-                    "result_id": "3d1bfbab-d9ec-46c7-aa8e-9c1d1808f2b8",
-                    "result_key": "out_horde_tanks",
-                    "created_at": "2020-09-24T19:07:59.311462",
-                    "created_by": "rogelio@example.com",
-                },
-                indent=4,
-                sort_keys=True,
-            ),
+            "return": TEMPLATE_RESULT_MAP_JSON,
         },
         {
             "args": [
@@ -2079,62 +1619,26 @@ def test_unsubscribe(unsubscribe_data):
                 "adora@example.com",
             ],
             "params": [
-                "cd987859-06fe-4b1a-9e96-47d4f36bf819",
+                TEMPLATE_ID,
                 "3d1bfbab-d9ec-46c7-aa8e-9c1d1808f2b8",
                 "out_horde_tanks",
                 "adora@example.com",
             ],
-            "from_names": {
-                "result_name": "Horde Tanks",
-                "result_return": json.dumps(
-                    [
-                        {
-                            "created_at": "2020-09-16T18:48:06.371563",
-                            "created_by": "adora@example.com",
-                            "result_type": "numeric",
-                            "description": "How many tanks",
-                            "name": "Horde Tanks",
-                            "result_id": "3d1bfbab-d9ec-46c7-aa8e-9c1d1808f2b8",
-                        }
-                    ],
-                    indent=4,
-                    sort_keys=True,
-                ),
-                "template_name": "Horde Template",
-                "template_return": json.dumps(
-                    [
-                        {
-                            "created_at": "2020-09-16T18:48:06.371563",
-                            "created_by": "adora@example.com",
-                            "description": "This template is for horde stuff",
-                            "test_wdl": "example.com/she-ra_test.wdl",
-                            "eval_wdl": "example.com/she-ra_eval.wdl",
-                            "name": "Horde Template",
-                            "pipeline_id": "4d1bfbab-d9ec-46c7-aa8e-9c1d1808f2b8",
-                            "template_id": "cd987859-06fe-4b1a-9e96-47d4f36bf819",
-                        }
-                    ],
-                    indent=4,
-                    sort_keys=True,
-                )
+            "from_name": {
+                "name": "Horde Template",
+                "return": HORDE_TEMPLATES_JSON,
             },
-            "return": json.dumps(
-                {
-                    "template_id": "cd987859-06fe-4b1a-9e96-47d4f36bf819",
-                    "result_id": "3d1bfbab-d9ec-46c7-aa8e-9c1d1808f2b8",
-                    "result_key": "out_horde_tanks",
-                    "created_at": "2020-09-24T19:07:59.311462",
-                    "created_by": "rogelio@example.com",
-                },
-                indent=4,
-                sort_keys=True,
-            ),
+            "result_from_name": {
+                "name": "Horde Tanks",
+                "return": HORDE_TANKS_RESULTS_JSON,
+            },
+            "return": TEMPLATE_RESULT_MAP_JSON,
         },
         {
             "args": [
                 "template",
                 "map_to_result",
-                "cd987859-06fe-4b1a-9e96-47d4f36bf819",
+                TEMPLATE_ID,
                 "3d1bfbab-d9ec-46c7-aa8e-9c1d1808f2b8",
                 "out_horde_tanks",
             ],
@@ -2145,40 +1649,26 @@ def test_unsubscribe(unsubscribe_data):
         {
             "args": ["template", "map_to_result"],
             "params": [],
-            "return": "Usage: carrot_cli template map_to_result [OPTIONS] TEMPLATE RESULT RESULT_KEY\n"
-            "Try 'carrot_cli template map_to_result -h' for help.\n"
-            "\n"
-            "Error: Missing argument 'TEMPLATE'.",
+            "return": missing_template_usage(
+                "map_to_result", "TEMPLATE RESULT RESULT_KEY"
+            ),
         },
-    ]
+    ],
+    ids=["by_id", "by_name", "no_email", "missing_args"],
 )
 def map_to_result_data(request):
-    # Set all requests to return None so only the one we expect will return a value
-    mockito.when(template_results).create_map(...).thenReturn(None)
-    # If there's a value for from_name, set the return value for trying to retrieve the existing
-    # record
-    if "from_names" in request.param:
-        mockito.when(results).find(
-            name=request.param["from_names"]["result_name"],
-            limit=2
-        ).thenReturn(request.param["from_names"]["result_return"])
-        mockito.when(templates).find(
-            name=request.param["from_names"]["template_name"],
-            limit=2
-        ).thenReturn(request.param["from_names"]["template_return"])
-    # Mock up request response only if we expect it to get that far
-    if len(request.param["params"]) > 0:
-        mockito.when(template_results).create_map(
-            request.param["params"][0],
-            request.param["params"][1],
-            request.param["params"][2],
-            request.param["params"][3],
-        ).thenReturn(request.param["return"])
+    # If there are values for from_name or result_from_name, set the return values for trying to
+    # retrieve the existing records
+    stub_name_lookup(templates, request.param.get("from_name"))
+    stub_name_lookup(results, request.param.get("result_from_name"))
+    # Mock up request response, returning None for any other call
+    mockito.when(template_results).create_map(...).thenAnswer(
+        answer_for(request.param["params"], request.param.get("return"))
+    )
     return request.param
 
 
-def test_map_to_result(map_to_result_data, caplog):
-    runner = CliRunner()
+def test_map_to_result(map_to_result_data, runner, caplog):
     result = runner.invoke(carrot, map_to_result_data["args"])
     if "logging" in map_to_result_data:
         assert map_to_result_data["logging"] in caplog.text
@@ -2186,30 +1676,57 @@ def test_map_to_result(map_to_result_data, caplog):
         assert result.output == map_to_result_data["return"] + "\n"
 
 
+def stub_map_find(map_module, lookup_module, lookup_key, method, find_data):
+    """
+    Mocks up the find request (named by method) on map_module, template_results or
+    template_reports, and the template name lookup and the lookup_module name lookup (under
+    lookup_key) for the find_data case
+    """
+    # If there are values for from_name or lookup_key, set the return values for trying to
+    # retrieve the existing records
+    stub_name_lookup(templates, find_data.get("from_name"))
+    stub_name_lookup(lookup_module, find_data.get(lookup_key))
+    # Mock up request response, returning None for any other call
+    getattr(mockito.when(map_module), method)(...).thenAnswer(
+        answer_for(find_data["params"], find_data["return"])
+    )
+
+
+def stub_map_delete(map_module, lookup_module, lookup_key, delete_data):
+    """
+    Mocks up the email config lookup, the delete and find requests on map_module,
+    template_results or template_reports, and the template name lookup and the lookup_module name
+    lookup (under lookup_key) for the delete_data case
+    """
+    # We want to load the value from "email" from config
+    mockito.when(config).load_var("email").thenReturn(delete_data["email"])
+    # If there are values for from_name or lookup_key, set the return values for trying to
+    # retrieve the existing records
+    stub_name_lookup(templates, delete_data.get("from_name"))
+    stub_name_lookup(lookup_module, delete_data.get(lookup_key))
+    # Mock up request responses, returning None for any other call
+    mockito.when(map_module).delete_map_by_ids(...).thenAnswer(
+        answer_for(delete_data["params"], delete_data["return"])
+    )
+    mockito.when(map_module).find_map_by_ids(...).thenAnswer(
+        answer_for(delete_data["params"], delete_data.get("find_return"))
+    )
+
+
 @pytest.fixture(
     params=[
         {
             "args": [
                 "template",
                 "find_result_map_by_id",
-                "cd987859-06fe-4b1a-9e96-47d4f36bf819",
-                "3d1bfbab-d9ec-46c7-aa8e-9c1d1808f2b8",
+                TEMPLATE_ID,
+                RESULT_ID,
             ],
             "params": [
-                "cd987859-06fe-4b1a-9e96-47d4f36bf819",
-                "3d1bfbab-d9ec-46c7-aa8e-9c1d1808f2b8",
+                TEMPLATE_ID,
+                RESULT_ID,
             ],
-            "return": json.dumps(
-                {
-                    "template_id": "cd987859-06fe-4b1a-9e96-47d4f36bf819",
-                    "result_id": "3d1bfbab-d9ec-46c7-aa8e-9c1d1808f2b8",
-                    "result_key": "out_horde_tanks",
-                    "created_at": "2020-09-24T19:07:59.311462",
-                    "created_by": "rogelio@example.com",
-                },
-                indent=4,
-                sort_keys=True,
-            ),
+            "return": TEMPLATE_RESULT_MAP_JSON,
         },
         {
             "args": [
@@ -2219,90 +1736,37 @@ def test_map_to_result(map_to_result_data, caplog):
                 "Horde Tanks",
             ],
             "params": [
-                "cd987859-06fe-4b1a-9e96-47d4f36bf819",
-                "3d1bfbab-d9ec-46c7-aa8e-9c1d1808f2b8",
+                TEMPLATE_ID,
+                RESULT_ID,
             ],
-            "from_names": {
-                "result_name": "Horde Tanks",
-                "result_return": json.dumps(
-                    [
-                        {
-                            "created_at": "2020-09-16T18:48:06.371563",
-                            "created_by": "adora@example.com",
-                            "result_type": "numeric",
-                            "description": "How many tanks",
-                            "name": "Horde Tanks",
-                            "result_id": "3d1bfbab-d9ec-46c7-aa8e-9c1d1808f2b8",
-                        }
-                    ],
-                    indent=4,
-                    sort_keys=True,
-                ),
-                "template_name": "Horde Template",
-                "template_return": json.dumps(
-                    [
-                        {
-                            "created_at": "2020-09-16T18:48:06.371563",
-                            "created_by": "adora@example.com",
-                            "description": "This template is for horde stuff",
-                            "test_wdl": "example.com/she-ra_test.wdl",
-                            "eval_wdl": "example.com/she-ra_eval.wdl",
-                            "name": "Horde Template",
-                            "pipeline_id": "4d1bfbab-d9ec-46c7-aa8e-9c1d1808f2b8",
-                            "template_id": "cd987859-06fe-4b1a-9e96-47d4f36bf819",
-                        }
-                    ],
-                    indent=4,
-                    sort_keys=True,
-                )
+            "from_name": {
+                "name": "Horde Template",
+                "return": HORDE_TEMPLATES_JSON,
             },
-            "return": json.dumps(
-                {
-                    "template_id": "cd987859-06fe-4b1a-9e96-47d4f36bf819",
-                    "result_id": "3d1bfbab-d9ec-46c7-aa8e-9c1d1808f2b8",
-                    "result_key": "out_horde_tanks",
-                    "created_at": "2020-09-24T19:07:59.311462",
-                    "created_by": "rogelio@example.com",
-                },
-                indent=4,
-                sort_keys=True,
-            ),
+            "result_from_name": {
+                "name": "Horde Tanks",
+                "return": HORDE_TANKS_RESULTS_JSON,
+            },
+            "return": TEMPLATE_RESULT_MAP_JSON,
         },
         {
             "args": ["template", "find_result_map_by_id"],
             "params": [],
-            "return": "Usage: carrot_cli template find_result_map_by_id [OPTIONS] TEMPLATE RESULT\n"
-            "Try 'carrot_cli template find_result_map_by_id -h' for help.\n"
-            "\n"
-            "Error: Missing argument 'TEMPLATE'.",
+            "return": missing_template_usage(
+                "find_result_map_by_id", "TEMPLATE RESULT"
+            ),
         },
-    ]
+    ],
+    ids=["by_id", "by_name", "missing_args"],
 )
 def find_result_map_by_id_data(request):
-    # Set all requests to return None so only the one we expect will return a value
-    mockito.when(template_results).find_map_by_ids(...).thenReturn(None)
-    # If there's a value for from_name, set the return value for trying to retrieve the existing
-    # record
-    if "from_names" in request.param:
-        mockito.when(results).find(
-            name=request.param["from_names"]["result_name"],
-            limit=2
-        ).thenReturn(request.param["from_names"]["result_return"])
-        mockito.when(templates).find(
-            name=request.param["from_names"]["template_name"],
-            limit=2
-        ).thenReturn(request.param["from_names"]["template_return"])
-    # Mock up request response only if we expect it to get that far
-    if len(request.param["params"]) > 0:
-        mockito.when(template_results).find_map_by_ids(
-            request.param["params"][0],
-            request.param["params"][1],
-        ).thenReturn(request.param["return"])
+    stub_map_find(
+        template_results, results, "result_from_name", "find_map_by_ids", request.param
+    )
     return request.param
 
 
-def test_find_result_map_by_id(find_result_map_by_id_data):
-    runner = CliRunner()
+def test_find_result_map_by_id(find_result_map_by_id_data, runner):
     result = runner.invoke(carrot, find_result_map_by_id_data["args"])
     assert result.output == find_result_map_by_id_data["return"] + "\n"
 
@@ -2313,9 +1777,9 @@ def test_find_result_map_by_id(find_result_map_by_id_data):
             "args": [
                 "template",
                 "find_result_maps",
-                "cd987859-06fe-4b1a-9e96-47d4f36bf819",
+                TEMPLATE_ID,
                 "--result_id",
-                "4d1bfbab-d9ec-46c7-aa8e-9c1d1808f2b8",
+                OTHER_RESULT_ID,
                 "--result_key",
                 "sword_of_protection_key",
                 "--created_by",
@@ -2332,8 +1796,8 @@ def test_find_result_map_by_id(find_result_map_by_id_data):
                 0,
             ],
             "params": [
-                "cd987859-06fe-4b1a-9e96-47d4f36bf819",
-                "4d1bfbab-d9ec-46c7-aa8e-9c1d1808f2b8",
+                TEMPLATE_ID,
+                OTHER_RESULT_ID,
                 "sword_of_protection_key",
                 "2020-10-00T00:00:00.000000",
                 "2020-09-00T00:00:00.000000",
@@ -2342,19 +1806,7 @@ def test_find_result_map_by_id(find_result_map_by_id_data):
                 1,
                 0,
             ],
-            "return": json.dumps(
-                [
-                    {
-                        "template_id": "cd987859-06fe-4b1a-9e96-47d4f36bf819",
-                        "result_id": "4d1bfbab-d9ec-46c7-aa8e-9c1d1808f2b8",
-                        "result_key": "sword_of_protection_key",
-                        "created_at": "2020-09-24T19:07:59.311462",
-                        "created_by": "adora@example.com",
-                    }
-                ],
-                indent=4,
-                sort_keys=True,
-            ),
+            "return": SWORD_RESULT_MAPS_JSON,
         },
         {
             "args": [
@@ -2379,8 +1831,8 @@ def test_find_result_map_by_id(find_result_map_by_id_data):
                 0,
             ],
             "params": [
-                "cd987859-06fe-4b1a-9e96-47d4f36bf819",
-                "4d1bfbab-d9ec-46c7-aa8e-9c1d1808f2b8",
+                TEMPLATE_ID,
+                OTHER_RESULT_ID,
                 "sword_of_protection_key",
                 "2020-10-00T00:00:00.000000",
                 "2020-09-00T00:00:00.000000",
@@ -2389,53 +1841,43 @@ def test_find_result_map_by_id(find_result_map_by_id_data):
                 1,
                 0,
             ],
-            "from_names": {
-                "result_name": "Horde Tanks",
-                "result_return": json.dumps(
+            "from_name": {
+                "name": "Horde Template",
+                "return": json.dumps(
                     [
                         {
                             "created_at": "2020-09-16T18:48:06.371563",
                             "created_by": "adora@example.com",
-                            "result_type": "numeric",
-                            "description": "How many tanks",
-                            "name": "Horde Tanks",
-                            "result_id": "4d1bfbab-d9ec-46c7-aa8e-9c1d1808f2b8",
+                            "description": "This template is for horde stuff",
+                            "test_wdl": "example.com/she-ra_test.wdl",
+                            "eval_wdl": "example.com/she-ra_eval.wdl",
+                            "name": "Horde Template",
+                            "pipeline_id": "3d1bfbab-d9ec-46c7-aa8e-9c1d1808f2b8",
+                            "template_id": TEMPLATE_ID,
                         }
                     ],
                     indent=4,
                     sort_keys=True,
                 ),
-                "template_name": "Horde Template",
-                "template_return": json.dumps(
+            },
+            "result_from_name": {
+                "name": "Horde Tanks",
+                "return": json.dumps(
                     [
                         {
                             "created_at": "2020-09-16T18:48:06.371563",
                             "created_by": "adora@example.com",
-                            "description": "This template is for horde stuff",
-                            "test_wdl": "example.com/she-ra_test.wdl",
-                            "eval_wdl": "example.com/she-ra_eval.wdl",
-                            "name": "Horde Template",
-                            "pipeline_id": "3d1bfbab-d9ec-46c7-aa8e-9c1d1808f2b8",
-                            "template_id": "cd987859-06fe-4b1a-9e96-47d4f36bf819",
+                            "result_type": "numeric",
+                            "description": "How many tanks",
+                            "name": "Horde Tanks",
+                            "result_id": OTHER_RESULT_ID,
                         }
                     ],
                     indent=4,
                     sort_keys=True,
-                )
+                ),
             },
-            "return": json.dumps(
-                [
-                    {
-                        "template_id": "cd987859-06fe-4b1a-9e96-47d4f36bf819",
-                        "result_id": "4d1bfbab-d9ec-46c7-aa8e-9c1d1808f2b8",
-                        "result_key": "sword_of_protection_key",
-                        "created_at": "2020-09-24T19:07:59.311462",
-                        "created_by": "adora@example.com",
-                    }
-                ],
-                indent=4,
-                sort_keys=True,
-            ),
+            "return": SWORD_RESULT_MAPS_JSON,
         },
         {
             "args": [
@@ -2464,39 +1906,17 @@ def test_find_result_map_by_id(find_result_map_by_id_data):
                 sort_keys=True,
             ),
         },
-    ]
+    ],
+    ids=["by_id", "by_name", "not_found"],
 )
 def find_result_maps_data(request):
-    # Set all requests to return None so only the one we expect will return a value
-    mockito.when(template_results).find_maps(...).thenReturn(None)
-    # If there's a value for from_name, set the return value for trying to retrieve the existing
-    # record
-    if "from_names" in request.param:
-        mockito.when(results).find(
-            name=request.param["from_names"]["result_name"],
-            limit=2
-        ).thenReturn(request.param["from_names"]["result_return"])
-        mockito.when(templates).find(
-            name=request.param["from_names"]["template_name"],
-            limit=2
-        ).thenReturn(request.param["from_names"]["template_return"])
-    # Mock up request response
-    mockito.when(template_results).find_maps(
-        request.param["params"][0],
-        request.param["params"][1],
-        request.param["params"][2],
-        request.param["params"][3],
-        request.param["params"][4],
-        request.param["params"][5],
-        request.param["params"][6],
-        request.param["params"][7],
-        request.param["params"][8],
-    ).thenReturn(request.param["return"])
+    stub_map_find(
+        template_results, results, "result_from_name", "find_maps", request.param
+    )
     return request.param
 
 
-def test_find_result_maps(find_result_maps_data):
-    runner = CliRunner()
+def test_find_result_maps(find_result_maps_data, runner):
     result = runner.invoke(carrot, find_result_maps_data["args"])
     assert result.output == find_result_maps_data["return"] + "\n"
 
@@ -2507,28 +1927,16 @@ def test_find_result_maps(find_result_maps_data):
             "args": [
                 "template",
                 "delete_result_map_by_id",
-                "cd987859-06fe-4b1a-9e96-47d4f36bf819",
-                "3d1bfbab-d9ec-46c7-aa8e-9c1d1808f2b8",
+                TEMPLATE_ID,
+                RESULT_ID,
             ],
-            "ids": [
-                "cd987859-06fe-4b1a-9e96-47d4f36bf819",
-                "3d1bfbab-d9ec-46c7-aa8e-9c1d1808f2b8",
+            "params": [
+                TEMPLATE_ID,
+                RESULT_ID,
             ],
-            "find_return": json.dumps(
-                {
-                    "template_id": "cd987859-06fe-4b1a-9e96-47d4f36bf819",
-                    "result_id": "4d1bfbab-d9ec-46c7-aa8e-9c1d1808f2b8",
-                    "result_key": "sword_of_protection_key",
-                    "created_at": "2020-09-24T19:07:59.311462",
-                    "created_by": "adora@example.com",
-                },
-                indent=4,
-                sort_keys=True,
-            ),
+            "find_return": SWORD_RESULT_MAP_JSON,
             "email": "adora@example.com",
-            "return": json.dumps(
-                {"message": "Successfully deleted 1 row"}, indent=4, sort_keys=True
-            ),
+            "return": DELETED_JSON,
         },
         {
             "args": [
@@ -2537,118 +1945,56 @@ def test_find_result_maps(find_result_maps_data):
                 "Horde Template",
                 "Horde Tanks",
             ],
-            "ids": [
-                "cd987859-06fe-4b1a-9e96-47d4f36bf819",
-                "3d1bfbab-d9ec-46c7-aa8e-9c1d1808f2b8",
+            "params": [
+                TEMPLATE_ID,
+                RESULT_ID,
             ],
-            "find_return": json.dumps(
-                {
-                    "template_id": "cd987859-06fe-4b1a-9e96-47d4f36bf819",
-                    "result_id": "4d1bfbab-d9ec-46c7-aa8e-9c1d1808f2b8",
-                    "result_key": "sword_of_protection_key",
-                    "created_at": "2020-09-24T19:07:59.311462",
-                    "created_by": "adora@example.com",
-                },
-                indent=4,
-                sort_keys=True,
-            ),
-            "from_names": {
-                "result_name": "Horde Tanks",
-                "result_return": json.dumps(
-                    [
-                        {
-                            "created_at": "2020-09-16T18:48:06.371563",
-                            "created_by": "adora@example.com",
-                            "result_type": "numeric",
-                            "description": "How many tanks",
-                            "name": "Horde Tanks",
-                            "result_id": "3d1bfbab-d9ec-46c7-aa8e-9c1d1808f2b8",
-                        }
-                    ],
-                    indent=4,
-                    sort_keys=True,
-                ),
-                "template_name": "Horde Template",
-                "template_return": json.dumps(
-                    [
-                        {
-                            "created_at": "2020-09-16T18:48:06.371563",
-                            "created_by": "adora@example.com",
-                            "description": "This template is for horde stuff",
-                            "test_wdl": "example.com/she-ra_test.wdl",
-                            "eval_wdl": "example.com/she-ra_eval.wdl",
-                            "name": "Horde Template",
-                            "pipeline_id": "4d1bfbab-d9ec-46c7-aa8e-9c1d1808f2b8",
-                            "template_id": "cd987859-06fe-4b1a-9e96-47d4f36bf819",
-                        }
-                    ],
-                    indent=4,
-                    sort_keys=True,
-                )
+            "find_return": SWORD_RESULT_MAP_JSON,
+            "from_name": {
+                "name": "Horde Template",
+                "return": HORDE_TEMPLATES_JSON,
+            },
+            "result_from_name": {
+                "name": "Horde Tanks",
+                "return": HORDE_TANKS_RESULTS_JSON,
             },
             "email": "adora@example.com",
-            "return": json.dumps(
-                {"message": "Successfully deleted 1 row"}, indent=4, sort_keys=True
-            ),
+            "return": DELETED_JSON,
         },
         {
             "args": [
                 "template",
                 "delete_result_map_by_id",
                 "-y",
-                "cd987859-06fe-4b1a-9e96-47d4f36bf819",
-                "3d1bfbab-d9ec-46c7-aa8e-9c1d1808f2b8",
+                TEMPLATE_ID,
+                RESULT_ID,
             ],
-            "ids": [
-                "cd987859-06fe-4b1a-9e96-47d4f36bf819",
-                "3d1bfbab-d9ec-46c7-aa8e-9c1d1808f2b8",
+            "params": [
+                TEMPLATE_ID,
+                RESULT_ID,
             ],
-            "find_return": json.dumps(
-                {
-                    "template_id": "cd987859-06fe-4b1a-9e96-47d4f36bf819",
-                    "result_id": "4d1bfbab-d9ec-46c7-aa8e-9c1d1808f2b8",
-                    "result_key": "sword_of_protection_key",
-                    "created_at": "2020-09-24T19:07:59.311462",
-                    "created_by": "adora@example.com",
-                },
-                indent=4,
-                sort_keys=True,
-            ),
+            "find_return": SWORD_RESULT_MAP_JSON,
             "email": "catra@example.com",
-            "return": json.dumps(
-                {"message": "Successfully deleted 1 row"}, indent=4, sort_keys=True
-            ),
+            "return": DELETED_JSON,
         },
         {
             "args": [
                 "template",
                 "delete_result_map_by_id",
-                "cd987859-06fe-4b1a-9e96-47d4f36bf819",
-                "3d1bfbab-d9ec-46c7-aa8e-9c1d1808f2b8",
+                TEMPLATE_ID,
+                RESULT_ID,
             ],
-            "ids": [
-                "cd987859-06fe-4b1a-9e96-47d4f36bf819",
-                "3d1bfbab-d9ec-46c7-aa8e-9c1d1808f2b8",
+            "params": [
+                TEMPLATE_ID,
+                RESULT_ID,
             ],
-            "find_return": json.dumps(
-                {
-                    "template_id": "cd987859-06fe-4b1a-9e96-47d4f36bf819",
-                    "result_id": "4d1bfbab-d9ec-46c7-aa8e-9c1d1808f2b8",
-                    "result_key": "sword_of_protection_key",
-                    "created_at": "2020-09-24T19:07:59.311462",
-                    "created_by": "adora@example.com",
-                },
-                indent=4,
-                sort_keys=True,
-            ),
+            "find_return": SWORD_RESULT_MAP_JSON,
             "email": "catra@example.com",
-            "return": json.dumps(
-                {"message": "Successfully deleted 1 row"}, indent=4, sort_keys=True
-            ),
+            "return": DELETED_JSON,
             "interactive": {
                 "input": "y",
-                "message": "Mapping for template with id cd987859-06fe-4b1a-9e96-47d4f36bf819 and "
-                "result with id 3d1bfbab-d9ec-46c7-aa8e-9c1d1808f2b8 was created by adora@example.com. Are "
+                "message": f"Mapping for template with id {TEMPLATE_ID} and "
+                f"result with id {RESULT_ID} was created by adora@example.com. Are "
                 "you sure you want to delete? [y/N]: y\n",
             },
         },
@@ -2656,30 +2002,20 @@ def test_find_result_maps(find_result_maps_data):
             "args": [
                 "template",
                 "delete_result_map_by_id",
-                "cd987859-06fe-4b1a-9e96-47d4f36bf819",
-                "3d1bfbab-d9ec-46c7-aa8e-9c1d1808f2b8",
+                TEMPLATE_ID,
+                RESULT_ID,
             ],
-            "ids": [
-                "cd987859-06fe-4b1a-9e96-47d4f36bf819",
-                "3d1bfbab-d9ec-46c7-aa8e-9c1d1808f2b8",
+            "params": [
+                TEMPLATE_ID,
+                RESULT_ID,
             ],
-            "find_return": json.dumps(
-                {
-                    "template_id": "cd987859-06fe-4b1a-9e96-47d4f36bf819",
-                    "result_id": "4d1bfbab-d9ec-46c7-aa8e-9c1d1808f2b8",
-                    "result_key": "sword_of_protection_key",
-                    "created_at": "2020-09-24T19:07:59.311462",
-                    "created_by": "adora@example.com",
-                },
-                indent=4,
-                sort_keys=True,
-            ),
+            "find_return": SWORD_RESULT_MAP_JSON,
             "email": "catra@example.com",
             "return": "",
             "interactive": {
                 "input": "n",
-                "message": "Mapping for template with id cd987859-06fe-4b1a-9e96-47d4f36bf819 and "
-                "result with id 3d1bfbab-d9ec-46c7-aa8e-9c1d1808f2b8 was created by adora@example.com. Are "
+                "message": f"Mapping for template with id {TEMPLATE_ID} and "
+                f"result with id {RESULT_ID} was created by adora@example.com. Are "
                 "you sure you want to delete? [y/N]: n",
             },
             "logging": "Okay, aborting delete operation",
@@ -2688,77 +2024,43 @@ def test_find_result_maps(find_result_maps_data):
             "args": [
                 "template",
                 "delete_result_map_by_id",
-                "cd987859-06fe-4b1a-9e96-47d4f36bf819",
-                "3d1bfbab-d9ec-46c7-aa8e-9c1d1808f2b8",
+                TEMPLATE_ID,
+                RESULT_ID,
             ],
-            "ids": [
-                "cd987859-06fe-4b1a-9e96-47d4f36bf819",
-                "3d1bfbab-d9ec-46c7-aa8e-9c1d1808f2b8",
+            "params": [
+                TEMPLATE_ID,
+                RESULT_ID,
             ],
-            "find_return": json.dumps(
-                {
-                    "title": "No template_result found",
-                    "status": 404,
-                    "detail": "No template_result found with the specified ID",
-                },
-                indent=4,
-                sort_keys=True,
-            ),
+            "find_return": NO_RESULT_MAP_FOUND_JSON,
             "email": "adora@example.com",
-            "return": json.dumps(
-                {
-                    "title": "No template_result found",
-                    "status": 404,
-                    "detail": "No template_result found with the specified ID",
-                },
-                indent=4,
-                sort_keys=True,
-            ),
+            "return": NO_RESULT_MAP_FOUND_JSON,
         },
         {
             "args": ["template", "delete_result_map_by_id"],
-            "ids": [],
+            "params": [],
             "email": "adora@example.com",
-            "return": "Usage: carrot_cli template delete_result_map_by_id [OPTIONS] TEMPLATE RESULT\n"
-            "Try 'carrot_cli template delete_result_map_by_id -h' for help.\n"
-            "\n"
-            "Error: Missing argument 'TEMPLATE'.",
-        },
-    ]
+            "return": missing_template_usage(
+                "delete_result_map_by_id", "TEMPLATE RESULT"
+            ),
+        },
+    ],
+    ids=[
+        "by_id",
+        "by_name",
+        "yes_flag",
+        "confirmed",
+        "aborted",
+        "not_found",
+        "missing_args",
+    ],
 )
 def delete_result_map_by_id_data(request):
-    # We want to load the value from "email" from config
-    mockito.when(config).load_var("email").thenReturn(request.param["email"])
-    # Set all requests to return None so only the one we expect will return a value
-    mockito.when(template_results).delete_map_by_ids(...).thenReturn(None)
-    mockito.when(template_results).find_map_by_ids(...).thenReturn(None)
-    # If there's a value for from_name, set the return value for trying to retrieve the existing
-    # record
-    if "from_names" in request.param:
-        mockito.when(results).find(
-            name=request.param["from_names"]["result_name"],
-            limit=2
-        ).thenReturn(request.param["from_names"]["result_return"])
-        mockito.when(templates).find(
-            name=request.param["from_names"]["template_name"],
-            limit=2
-        ).thenReturn(request.param["from_names"]["template_return"])
-    # Mock up request response only if we expect it to get that far
-    if len(request.param["ids"]) > 0:
-        mockito.when(template_results).delete_map_by_ids(
-            request.param["ids"][0],
-            request.param["ids"][1],
-        ).thenReturn(request.param["return"])
-        mockito.when(template_results).find_map_by_ids(
-            request.param["ids"][0],
-            request.param["ids"][1],
-        ).thenReturn(request.param["find_return"])
+    stub_map_delete(template_results, results, "result_from_name", request.param)
     return request.param
 
 
-def test_delete_result_map_by_id(delete_result_map_by_id_data, caplog):
+def test_delete_result_map_by_id(delete_result_map_by_id_data, runner, caplog):
     caplog.set_level(logging.INFO)
-    runner = CliRunner()
     # Include interactive input and expected message if this test should trigger interactive stuff
     if "interactive" in delete_result_map_by_id_data:
         expected_output = (
@@ -2786,28 +2088,18 @@ def test_delete_result_map_by_id(delete_result_map_by_id_data, caplog):
             "args": [
                 "template",
                 "map_to_report",
-                "cd987859-06fe-4b1a-9e96-47d4f36bf819",
-                "3d1bfbab-d9ec-46c7-aa8e-9c1d1808f2b8",
+                TEMPLATE_ID,
+                REPORT_ID,
                 "--created_by",
                 "adora@example.com",
             ],
             "params": [
-                "cd987859-06fe-4b1a-9e96-47d4f36bf819",
-                "3d1bfbab-d9ec-46c7-aa8e-9c1d1808f2b8",
+                TEMPLATE_ID,
+                REPORT_ID,
                 "single",
                 "adora@example.com",
             ],
-            "return": json.dumps(
-                {
-                    "template_id": "cd987859-06fe-4b1a-9e96-47d4f36bf819",
-                    "report_id": "3d1bfbab-d9ec-46c7-aa8e-9c1d1808f2b8",
-                    "report_trigger": "single",
-                    "created_at": "2020-09-24T19:07:59.311462",
-                    "created_by": "rogelio@example.com",
-                },
-                indent=4,
-                sort_keys=True,
-            ),
+            "return": TEMPLATE_REPORT_MAP_JSON,
         },
         {
             "args": [
@@ -2820,103 +2112,23 @@ def test_delete_result_map_by_id(delete_result_map_by_id_data, caplog):
                 "adora@example.com",
             ],
             "params": [
-                "cd987859-06fe-4b1a-9e96-47d4f36bf819",
-                "3d1bfbab-d9ec-46c7-aa8e-9c1d1808f2b8",
+                TEMPLATE_ID,
+                REPORT_ID,
                 "pr",
                 "adora@example.com",
             ],
-            "from_names": {
-                "report_name": "Horde Report",
-                "report_return": json.dumps(
-                    [
-                        {
-                            "config": {"cpu": 2},
-                            "created_at": "2020-09-16T18:48:06.371563",
-                            "created_by": "adora@example.com",
-                            "description": "This old report is old",
-                            "name": "Horde Report",
-                            "notebook": {
-                                "metadata": {
-                                    "language_info": {
-                                        "codemirror_mode": {"name": "ipython", "version": 3},
-                                        "file_extension": ".py",
-                                        "mimetype": "text/x-python",
-                                        "name": "python",
-                                        "nbconvert_exporter": "python",
-                                        "pygments_lexer": "ipython3",
-                                        "version": "3.8.5-final",
-                                    },
-                                    "orig_nbformat": 2,
-                                    "kernelspec": {
-                                        "name": "python3",
-                                        "display_name": "Python 3.8.5 64-bit",
-                                        "metadata": {
-                                            "interpreter": {
-                                                "hash": "1ee38ef4a5a9feb55287fd749643f13d043cb0a7addaab2a9c224cbe137c0062"
-                                            }
-                                        },
-                                    },
-                                },
-                                "nbformat": 4,
-                                "nbformat_minor": 2,
-                                "cells": [
-                                    {
-                                        "cell_type": "code",
-                                        "execution_count": None,
-                                        "metadata": {},
-                                        "outputs": [],
-                                        "source": [
-                                            'message = carrot_run_data["results"]["Greeting"]\n',
-                                            "print(message)",
-                                        ],
-                                    },
-                                    {
-                                        "cell_type": "code",
-                                        "execution_count": None,
-                                        "metadata": {},
-                                        "outputs": [],
-                                        "source": [
-                                            'message_file = open(carrot_downloads["results"]["File Result"], \'r\')\n',
-                                            "print(message_file.read())",
-                                        ],
-                                    },
-                                    {
-                                        "cell_type": "code",
-                                        "execution_count": None,
-                                        "metadata": {},
-                                        "outputs": [],
-                                        "source": ["print('Thanks')"],
-                                    },
-                                ],
-                            },
-                            "report_id": "3d1bfbab-d9ec-46c7-aa8e-9c1d1808f2b8",
-                        }
-                    ],
-                    indent=4,
-                    sort_keys=True,
-                ),
-                "template_name": "Horde Template",
-                "template_return": json.dumps(
-                    [
-                        {
-                            "created_at": "2020-09-16T18:48:06.371563",
-                            "created_by": "adora@example.com",
-                            "description": "This template is for horde stuff",
-                            "test_wdl": "example.com/she-ra_test.wdl",
-                            "eval_wdl": "example.com/she-ra_eval.wdl",
-                            "name": "Horde Template",
-                            "pipeline_id": "4d1bfbab-d9ec-46c7-aa8e-9c1d1808f2b8",
-                            "template_id": "cd987859-06fe-4b1a-9e96-47d4f36bf819",
-                        }
-                    ],
-                    indent=4,
-                    sort_keys=True,
-                )
+            "from_name": {
+                "name": "Horde Template",
+                "return": HORDE_TEMPLATES_JSON,
+            },
+            "report_from_name": {
+                "name": "Horde Report",
+                "return": HORDE_REPORTS_JSON,
             },
             "return": json.dumps(
                 {
-                    "template_id": "cd987859-06fe-4b1a-9e96-47d4f36bf819",
-                    "report_id": "3d1bfbab-d9ec-46c7-aa8e-9c1d1808f2b8",
+                    "template_id": TEMPLATE_ID,
+                    "report_id": REPORT_ID,
                     "report_trigger": "pr",
                     "created_at": "2020-09-24T19:07:59.311462",
                     "created_by": "rogelio@example.com",
@@ -2929,8 +2141,8 @@ def test_delete_result_map_by_id(delete_result_map_by_id_data, caplog):
             "args": [
                 "template",
                 "map_to_report",
-                "cd987859-06fe-4b1a-9e96-47d4f36bf819",
-                "3d1bfbab-d9ec-46c7-aa8e-9c1d1808f2b8",
+                TEMPLATE_ID,
+                REPORT_ID,
                 "single"
             ],
             "params": [],
@@ -2940,40 +2152,26 @@ def test_delete_result_map_by_id(delete_result_map_by_id_data, caplog):
         {
             "args": ["template", "map_to_report"],
             "params": [],
-            "return": "Usage: carrot_cli template map_to_report [OPTIONS] TEMPLATE REPORT [[single|pr]]\n"
-            "Try 'carrot_cli template map_to_report -h' for help.\n"
-            "\n"
-            "Error: Missing argument 'TEMPLATE'.",
+            "return": missing_template_usage(
+                "map_to_report", "TEMPLATE REPORT [[single|pr]]"
+            ),
         },
-    ]
+    ],
+    ids=["by_id", "by_name", "no_email", "missing_args"],
 )
 def map_to_report_data(request):
-    # Set all requests to return None so only the one we expect will return a value
-    mockito.when(template_reports).create_map(...).thenReturn(None)
-    # If there's a value for from_name, set the return value for trying to retrieve the existing
-    # record
-    if "from_names" in request.param:
-        mockito.when(reports).find(
-            name=request.param["from_names"]["report_name"],
-            limit=2
-        ).thenReturn(request.param["from_names"]["report_return"])
-        mockito.when(templates).find(
-            name=request.param["from_names"]["template_name"],
-            limit=2
-        ).thenReturn(request.param["from_names"]["template_return"])
-    # Mock up request response only if we expect it to get that far
-    if len(request.param["params"]) > 0:
-        mockito.when(template_reports).create_map(
-            request.param["params"][0],
-            request.param["params"][1],
-            request.param["params"][2],
-            request.param["params"][3]
-        ).thenReturn(request.param["return"])
+    # If there are values for from_name or report_from_name, set the return values for trying to
+    # retrieve the existing records
+    stub_name_lookup(templates, request.param.get("from_name"))
+    stub_name_lookup(reports, request.param.get("report_from_name"))
+    # Mock up request response, returning None for any other call
+    mockito.when(template_reports).create_map(...).thenAnswer(
+        answer_for(request.param["params"], request.param.get("return"))
+    )
     return request.param
 
 
-def test_map_to_report(map_to_report_data, caplog):
-    runner = CliRunner()
+def test_map_to_report(map_to_report_data, runner, caplog):
     result = runner.invoke(carrot, map_to_report_data["args"])
     if "logging" in map_to_report_data:
         assert map_to_report_data["logging"] in caplog.text
@@ -2987,27 +2185,16 @@ def test_map_to_report(map_to_report_data, caplog):
             "args": [
                 "template",
                 "find_report_map_by_id",
-                "cd987859-06fe-4b1a-9e96-47d4f36bf819",
-                "3d1bfbab-d9ec-46c7-aa8e-9c1d1808f2b8",
+                TEMPLATE_ID,
+                REPORT_ID,
                 "single"
             ],
             "params": [
-                "cd987859-06fe-4b1a-9e96-47d4f36bf819",
-                "3d1bfbab-d9ec-46c7-aa8e-9c1d1808f2b8",
+                TEMPLATE_ID,
+                REPORT_ID,
                 "single"
             ],
-            "return": json.dumps(
-                {
-                    "template_id": "cd987859-06fe-4b1a-9e96-47d4f36bf819",
-                    "report_id": "3d1bfbab-d9ec-46c7-aa8e-9c1d1808f2b8",
-                    "report_trigger": "single",
-                    "input_map": {"section1": {"input1": "val1"}},
-                    "created_at": "2020-09-24T19:07:59.311462",
-                    "created_by": "rogelio@example.com",
-                },
-                indent=4,
-                sort_keys=True,
-            ),
+            "return": TEMPLATE_REPORT_MAP_WITH_INPUTS_JSON,
         },
         {
             "args": [
@@ -3018,110 +2205,19 @@ def test_map_to_report(map_to_report_data, caplog):
                 "single"
             ],
             "params": [
-                "cd987859-06fe-4b1a-9e96-47d4f36bf819",
-                "3d1bfbab-d9ec-46c7-aa8e-9c1d1808f2b8",
+                TEMPLATE_ID,
+                REPORT_ID,
                 "single"
             ],
-            "from_names": {
-                "report_name": "Horde Report",
-                "report_return": json.dumps(
-                    [
-                        {
-                            "config": {"cpu": 2},
-                            "created_at": "2020-09-16T18:48:06.371563",
-                            "created_by": "adora@example.com",
-                            "description": "This old report is old",
-                            "name": "Horde Report",
-                            "notebook": {
-                                "metadata": {
-                                    "language_info": {
-                                        "codemirror_mode": {"name": "ipython", "version": 3},
-                                        "file_extension": ".py",
-                                        "mimetype": "text/x-python",
-                                        "name": "python",
-                                        "nbconvert_exporter": "python",
-                                        "pygments_lexer": "ipython3",
-                                        "version": "3.8.5-final",
-                                    },
-                                    "orig_nbformat": 2,
-                                    "kernelspec": {
-                                        "name": "python3",
-                                        "display_name": "Python 3.8.5 64-bit",
-                                        "metadata": {
-                                            "interpreter": {
-                                                "hash": "1ee38ef4a5a9feb55287fd749643f13d043cb0a7addaab2a9c224cbe137c0062"
-                                            }
-                                        },
-                                    },
-                                },
-                                "nbformat": 4,
-                                "nbformat_minor": 2,
-                                "cells": [
-                                    {
-                                        "cell_type": "code",
-                                        "execution_count": None,
-                                        "metadata": {},
-                                        "outputs": [],
-                                        "source": [
-                                            'message = carrot_run_data["results"]["Greeting"]\n',
-                                            "print(message)",
-                                        ],
-                                    },
-                                    {
-                                        "cell_type": "code",
-                                        "execution_count": None,
-                                        "metadata": {},
-                                        "outputs": [],
-                                        "source": [
-                                            'message_file = open(carrot_downloads["results"]["File Result"], \'r\')\n',
-                                            "print(message_file.read())",
-                                        ],
-                                    },
-                                    {
-                                        "cell_type": "code",
-                                        "execution_count": None,
-                                        "metadata": {},
-                                        "outputs": [],
-                                        "source": ["print('Thanks')"],
-                                    },
-                                ],
-                            },
-                            "report_id": "3d1bfbab-d9ec-46c7-aa8e-9c1d1808f2b8",
-                        }
-                    ],
-                    indent=4,
-                    sort_keys=True,
-                ),
-                "template_name": "Horde Template",
-                "template_return": json.dumps(
-                    [
-                        {
-                            "created_at": "2020-09-16T18:48:06.371563",
-                            "created_by": "adora@example.com",
-                            "description": "This template is for horde stuff",
-                            "test_wdl": "example.com/she-ra_test.wdl",
-                            "eval_wdl": "example.com/she-ra_eval.wdl",
-                            "name": "Horde Template",
-                            "pipeline_id": "4d1bfbab-d9ec-46c7-aa8e-9c1d1808f2b8",
-                            "template_id": "cd987859-06fe-4b1a-9e96-47d4f36bf819",
-                        }
-                    ],
-                    indent=4,
-                    sort_keys=True,
-                )
+            "from_name": {
+                "name": "Horde Template",
+                "return": HORDE_TEMPLATES_JSON,
             },
-            "return": json.dumps(
-                {
-                    "template_id": "cd987859-06fe-4b1a-9e96-47d4f36bf819",
-                    "report_id": "3d1bfbab-d9ec-46c7-aa8e-9c1d1808f2b8",
-                    "report_trigger": "single",
-                    "input_map": {"section1": {"input1": "val1"}},
-                    "created_at": "2020-09-24T19:07:59.311462",
-                    "created_by": "rogelio@example.com",
-                },
-                indent=4,
-                sort_keys=True,
-            ),
+            "report_from_name": {
+                "name": "Horde Report",
+                "return": HORDE_REPORTS_JSON,
+            },
+            "return": TEMPLATE_REPORT_MAP_WITH_INPUTS_JSON,
         },
         {
             "args": ["template", "find_report_map_by_id"],
@@ -3132,34 +2228,17 @@ def test_map_to_report(map_to_report_data, caplog):
             "\n"
             "Error: Missing argument 'TEMPLATE'.",
         },
-    ]
+    ],
+    ids=["by_id", "by_name", "missing_args"],
 )
 def find_report_map_by_id_data(request):
-    # Set all requests to return None so only the one we expect will return a value
-    mockito.when(template_reports).find_map_by_ids(...).thenReturn(None)
-    # If there's a value for from_name, set the return value for trying to retrieve the existing
-    # record
-    if "from_names" in request.param:
-        mockito.when(reports).find(
-            name=request.param["from_names"]["report_name"],
-            limit=2
-        ).thenReturn(request.param["from_names"]["report_return"])
-        mockito.when(templates).find(
-            name=request.param["from_names"]["template_name"],
-            limit=2
-        ).thenReturn(request.param["from_names"]["template_return"])
-    # Mock up request response only if we expect it to get that far
-    if len(request.param["params"]) > 0:
-        mockito.when(template_reports).find_map_by_ids(
-            request.param["params"][0],
-            request.param["params"][1],
-            request.param["params"][2]
-        ).thenReturn(request.param["return"])
+    stub_map_find(
+        template_reports, reports, "report_from_name", "find_map_by_ids", request.param
+    )
     return request.param
 
 
-def test_find_report_map_by_id(find_report_map_by_id_data):
-    runner = CliRunner()
+def test_find_report_map_by_id(find_report_map_by_id_data, runner):
     result = runner.invoke(carrot, find_report_map_by_id_data["args"])
     assert result.output == find_report_map_by_id_data["return"] + "\n"
 
@@ -3170,9 +2249,9 @@ def test_find_report_map_by_id(find_report_map_by_id_data):
             "args": [
                 "template",
                 "find_report_maps",
-                "cd987859-06fe-4b1a-9e96-47d4f36bf819",
+                TEMPLATE_ID,
                 "--report_id",
-                "4d1bfbab-d9ec-46c7-aa8e-9c1d1808f2b8",
+                OTHER_REPORT_ID,
                 "--report_trigger",
                 "single",
                 "--created_by",
@@ -3189,8 +2268,8 @@ def test_find_report_map_by_id(find_report_map_by_id_data):
                 0,
             ],
             "params": [
-                "cd987859-06fe-4b1a-9e96-47d4f36bf819",
-                "4d1bfbab-d9ec-46c7-aa8e-9c1d1808f2b8",
+                TEMPLATE_ID,
+                OTHER_REPORT_ID,
                 "single",
                 "2020-10-00T00:00:00.000000",
                 "2020-09-00T00:00:00.000000",
@@ -3199,19 +2278,7 @@ def test_find_report_map_by_id(find_report_map_by_id_data):
                 1,
                 0,
             ],
-            "return": json.dumps(
-                [
-                    {
-                        "template_id": "cd987859-06fe-4b1a-9e96-47d4f36bf819",
-                        "report_id": "4d1bfbab-d9ec-46c7-aa8e-9c1d1808f2b8",
-                        "report_trigger": "single",
-                        "created_at": "2020-09-24T19:07:59.311462",
-                        "created_by": "adora@example.com",
-                    }
-                ],
-                indent=4,
-                sort_keys=True,
-            ),
+            "return": TEMPLATE_REPORT_MAPS_JSON,
         },
         {
             "args": [
@@ -3236,8 +2303,8 @@ def test_find_report_map_by_id(find_report_map_by_id_data):
                 0,
             ],
             "params": [
-                "cd987859-06fe-4b1a-9e96-47d4f36bf819",
-                "4d1bfbab-d9ec-46c7-aa8e-9c1d1808f2b8",
+                TEMPLATE_ID,
+                OTHER_REPORT_ID,
                 "single",
                 "2020-10-00T00:00:00.000000",
                 "2020-09-00T00:00:00.000000",
@@ -3246,107 +2313,44 @@ def test_find_report_map_by_id(find_report_map_by_id_data):
                 1,
                 0,
             ],
-            "from_names": {
-                "report_name": "Horde Report",
-                "report_return": json.dumps(
+            "from_name": {
+                "name": "Horde Template",
+                "return": json.dumps(
                     [
                         {
-                            "config": {"cpu": 2},
                             "created_at": "2020-09-16T18:48:06.371563",
                             "created_by": "adora@example.com",
-                            "description": "This old report is old",
-                            "name": "Horde Report",
-                            "notebook": {
-                                "metadata": {
-                                    "language_info": {
-                                        "codemirror_mode": {"name": "ipython", "version": 3},
-                                        "file_extension": ".py",
-                                        "mimetype": "text/x-python",
-                                        "name": "python",
-                                        "nbconvert_exporter": "python",
-                                        "pygments_lexer": "ipython3",
-                                        "version": "3.8.5-final",
-                                    },
-                                    "orig_nbformat": 2,
-                                    "kernelspec": {
-                                        "name": "python3",
-                                        "display_name": "Python 3.8.5 64-bit",
-                                        "metadata": {
-                                            "interpreter": {
-                                                "hash": "1ee38ef4a5a9feb55287fd749643f13d043cb0a7addaab2a9c224cbe137c0062"
-                                            }
-                                        },
-                                    },
-                                },
-                                "nbformat": 4,
-                                "nbformat_minor": 2,
-                                "cells": [
-                                    {
-                                        "cell_type": "code",
-                                        "execution_count": None,
-                                        "metadata": {},
-                                        "outputs": [],
-                                        "source": [
-                                            'message = carrot_run_data["results"]["Greeting"]\n',
-                                            "print(message)",
-                                        ],
-                                    },
-                                    {
-                                        "cell_type": "code",
-                                        "execution_count": None,
-                                        "metadata": {},
-                                        "outputs": [],
-                                        "source": [
-                                            'message_file = open(carrot_downloads["results"]["File Result"], \'r\')\n',
-                                            "print(message_file.read())",
-                                        ],
-                                    },
-                                    {
-                                        "cell_type": "code",
-                                        "execution_count": None,
-                                        "metadata": {},
-                                        "outputs": [],
-                                        "source": ["print('Thanks')"],
-                                    },
-                                ],
-                            },
-                            "report_id": "4d1bfbab-d9ec-46c7-aa8e-9c1d1808f2b8",
+                            "description": "This template is for horde stuff",
+                            "test_wdl": "example.com/she-ra_test.wdl",
+                            "eval_wdl": "example.com/she-ra_eval.wdl",
+                            "name": "Horde Template",
+                            "pipeline_id": "3d1bfbab-d9ec-46c7-aa8e-9c1d1808f2b8",
+                            "template_id": TEMPLATE_ID,
                         }
                     ],
                     indent=4,
                     sort_keys=True,
                 ),
-                "template_name": "Horde Template",
-                "template_return": json.dumps(
+            },
+            "report_from_name": {
+                "name": "Horde Report",
+                "return": json.dumps(
                     [
                         {
+                            "config": {"cpu": 2},
                             "created_at": "2020-09-16T18:48:06.371563",
                             "created_by": "adora@example.com",
-                            "description": "This template is for horde stuff",
-                            "test_wdl": "example.com/she-ra_test.wdl",
-                            "eval_wdl": "example.com/she-ra_eval.wdl",
-                            "name": "Horde Template",
-                            "pipeline_id": "3d1bfbab-d9ec-46c7-aa8e-9c1d1808f2b8",
-                            "template_id": "cd987859-06fe-4b1a-9e96-47d4f36bf819",
+                            "description": "This old report is old",
+                            "name": "Horde Report",
+                            "notebook": NOTEBOOK,
+                            "report_id": OTHER_REPORT_ID,
                         }
                     ],
                     indent=4,
                     sort_keys=True,
-                )
+                ),
             },
-            "return": json.dumps(
-                [
-                    {
-                        "template_id": "cd987859-06fe-4b1a-9e96-47d4f36bf819",
-                        "report_id": "4d1bfbab-d9ec-46c7-aa8e-9c1d1808f2b8",
-                        "report_trigger": "single",
-                        "created_at": "2020-09-24T19:07:59.311462",
-                        "created_by": "adora@example.com",
-                    }
-                ],
-                indent=4,
-                sort_keys=True,
-            ),
+            "return": TEMPLATE_REPORT_MAPS_JSON,
         },
         {
             "args": [
@@ -3375,39 +2379,17 @@ def test_find_report_map_by_id(find_report_map_by_id_data):
                 sort_keys=True,
             ),
         },
-    ]
+    ],
+    ids=["by_id", "by_name", "not_found"],
 )
 def find_report_maps_data(request):
-    # Set all requests to return None so only the one we expect will return a value
-    mockito.when(template_reports).find_maps(...).thenReturn(None)
-    # If there's a value for from_name, set the return value for trying to retrieve the existing
-    # record
-    if "from_names" in request.param:
-        mockito.when(reports).find(
-            name=request.param["from_names"]["report_name"],
-            limit=2
-        ).thenReturn(request.param["from_names"]["report_return"])
-        mockito.when(templates).find(
-            name=request.param["from_names"]["template_name"],
-            limit=2
-        ).thenReturn(request.param["from_names"]["template_return"])
-    # Mock up request response
-    mockito.when(template_reports).find_maps(
-        request.param["params"][0],
-        request.param["params"][1],
-        request.param["params"][2],
-        request.param["params"][3],
-        request.param["params"][4],
-        request.param["params"][5],
-        request.param["params"][6],
-        request.param["params"][7],
-        request.param["params"][8],
-    ).thenReturn(request.param["return"])
+    stub_map_find(
+        template_reports, reports, "report_from_name", "find_maps", request.param
+    )
     return request.param
 
 
-def test_find_report_maps(find_report_maps_data):
-    runner = CliRunner()
+def test_find_report_maps(find_report_maps_data, runner):
     result = runner.invoke(carrot, find_report_maps_data["args"])
     assert result.output == find_report_maps_data["return"] + "\n"
 
@@ -3418,30 +2400,18 @@ def test_find_report_maps(find_report_maps_data):
             "args": [
                 "template",
                 "delete_report_map_by_id",
-                "cd987859-06fe-4b1a-9e96-47d4f36bf819",
-                "3d1bfbab-d9ec-46c7-aa8e-9c1d1808f2b8",
+                TEMPLATE_ID,
+                REPORT_ID,
                 "single"
             ],
             "params": [
-                "cd987859-06fe-4b1a-9e96-47d4f36bf819",
-                "3d1bfbab-d9ec-46c7-aa8e-9c1d1808f2b8",
+                TEMPLATE_ID,
+                REPORT_ID,
                 "single"
             ],
-            "find_return": json.dumps(
-                {
-                    "template_id": "cd987859-06fe-4b1a-9e96-47d4f36bf819",
-                    "report_id": "3d1bfbab-d9ec-46c7-aa8e-9c1d1808f2b8",
-                    "report_trigger": "single",
-                    "created_at": "2020-09-24T19:07:59.311462",
-                    "created_by": "rogelio@example.com",
-                },
-                indent=4,
-                sort_keys=True,
-            ),
+            "find_return": TEMPLATE_REPORT_MAP_JSON,
             "email": "rogelio@example.com",
-            "return": json.dumps(
-                {"message": "Successfully deleted 1 row"}, indent=4, sort_keys=True
-            ),
+            "return": DELETED_JSON,
         },
         {
             "args": [
@@ -3452,176 +2422,60 @@ def test_find_report_maps(find_report_maps_data):
                 "single"
             ],
             "params": [
-                "cd987859-06fe-4b1a-9e96-47d4f36bf819",
-                "3d1bfbab-d9ec-46c7-aa8e-9c1d1808f2b8",
+                TEMPLATE_ID,
+                REPORT_ID,
                 "single"
             ],
-            "find_return": json.dumps(
-                {
-                    "template_id": "cd987859-06fe-4b1a-9e96-47d4f36bf819",
-                    "report_id": "3d1bfbab-d9ec-46c7-aa8e-9c1d1808f2b8",
-                    "report_trigger": "single",
-                    "created_at": "2020-09-24T19:07:59.311462",
-                    "created_by": "rogelio@example.com",
-                },
-                indent=4,
-                sort_keys=True,
-            ),
-            "from_names": {
-                "report_name": "Horde Report",
-                "report_return": json.dumps(
-                    [
-                        {
-                            "config": {"cpu": 2},
-                            "created_at": "2020-09-16T18:48:06.371563",
-                            "created_by": "adora@example.com",
-                            "description": "This old report is old",
-                            "name": "Horde Report",
-                            "notebook": {
-                                "metadata": {
-                                    "language_info": {
-                                        "codemirror_mode": {"name": "ipython", "version": 3},
-                                        "file_extension": ".py",
-                                        "mimetype": "text/x-python",
-                                        "name": "python",
-                                        "nbconvert_exporter": "python",
-                                        "pygments_lexer": "ipython3",
-                                        "version": "3.8.5-final",
-                                    },
-                                    "orig_nbformat": 2,
-                                    "kernelspec": {
-                                        "name": "python3",
-                                        "display_name": "Python 3.8.5 64-bit",
-                                        "metadata": {
-                                            "interpreter": {
-                                                "hash": "1ee38ef4a5a9feb55287fd749643f13d043cb0a7addaab2a9c224cbe137c0062"
-                                            }
-                                        },
-                                    },
-                                },
-                                "nbformat": 4,
-                                "nbformat_minor": 2,
-                                "cells": [
-                                    {
-                                        "cell_type": "code",
-                                        "execution_count": None,
-                                        "metadata": {},
-                                        "outputs": [],
-                                        "source": [
-                                            'message = carrot_run_data["results"]["Greeting"]\n',
-                                            "print(message)",
-                                        ],
-                                    },
-                                    {
-                                        "cell_type": "code",
-                                        "execution_count": None,
-                                        "metadata": {},
-                                        "outputs": [],
-                                        "source": [
-                                            'message_file = open(carrot_downloads["results"]["File Result"], \'r\')\n',
-                                            "print(message_file.read())",
-                                        ],
-                                    },
-                                    {
-                                        "cell_type": "code",
-                                        "execution_count": None,
-                                        "metadata": {},
-                                        "outputs": [],
-                                        "source": ["print('Thanks')"],
-                                    },
-                                ],
-                            },
-                            "report_id": "3d1bfbab-d9ec-46c7-aa8e-9c1d1808f2b8",
-                        }
-                    ],
-                    indent=4,
-                    sort_keys=True,
-                ),
-                "template_name": "Horde Template",
-                "template_return": json.dumps(
-                    [
-                        {
-                            "created_at": "2020-09-16T18:48:06.371563",
-                            "created_by": "adora@example.com",
-                            "description": "This template is for horde stuff",
-                            "test_wdl": "example.com/she-ra_test.wdl",
-                            "eval_wdl": "example.com/she-ra_eval.wdl",
-                            "name": "Horde Template",
-                            "pipeline_id": "4d1bfbab-d9ec-46c7-aa8e-9c1d1808f2b8",
-                            "template_id": "cd987859-06fe-4b1a-9e96-47d4f36bf819",
-                        }
-                    ],
-                    indent=4,
-                    sort_keys=True,
-                )
+            "find_return": TEMPLATE_REPORT_MAP_JSON,
+            "from_name": {
+                "name": "Horde Template",
+                "return": HORDE_TEMPLATES_JSON,
+            },
+            "report_from_name": {
+                "name": "Horde Report",
+                "return": HORDE_REPORTS_JSON,
             },
             "email": "rogelio@example.com",
-            "return": json.dumps(
-                {"message": "Successfully deleted 1 row"}, indent=4, sort_keys=True
-            ),
+            "return": DELETED_JSON,
         },
         {
             "args": [
                 "template",
                 "delete_report_map_by_id",
                 "-y",
-                "cd987859-06fe-4b1a-9e96-47d4f36bf819",
-                "3d1bfbab-d9ec-46c7-aa8e-9c1d1808f2b8",
+                TEMPLATE_ID,
+                REPORT_ID,
                 "single"
             ],
             "params": [
-                "cd987859-06fe-4b1a-9e96-47d4f36bf819",
-                "3d1bfbab-d9ec-46c7-aa8e-9c1d1808f2b8",
+                TEMPLATE_ID,
+                REPORT_ID,
                 "single"
             ],
-            "find_return": json.dumps(
-                {
-                    "template_id": "cd987859-06fe-4b1a-9e96-47d4f36bf819",
-                    "report_id": "3d1bfbab-d9ec-46c7-aa8e-9c1d1808f2b8",
-                    "report_trigger": "single",
-                    "created_at": "2020-09-24T19:07:59.311462",
-                    "created_by": "rogelio@example.com",
-                },
-                indent=4,
-                sort_keys=True,
-            ),
+            "find_return": TEMPLATE_REPORT_MAP_JSON,
             "email": "adora@example.com",
-            "return": json.dumps(
-                {"message": "Successfully deleted 1 row"}, indent=4, sort_keys=True
-            ),
+            "return": DELETED_JSON,
         },
         {
             "args": [
                 "template",
                 "delete_report_map_by_id",
-                "cd987859-06fe-4b1a-9e96-47d4f36bf819",
-                "3d1bfbab-d9ec-46c7-aa8e-9c1d1808f2b8",
+                TEMPLATE_ID,
+                REPORT_ID,
                 "single"
             ],
             "params": [
-                "cd987859-06fe-4b1a-9e96-47d4f36bf819",
-                "3d1bfbab-d9ec-46c7-aa8e-9c1d1808f2b8",
+                TEMPLATE_ID,
+                REPORT_ID,
                 "single"
             ],
-            "find_return": json.dumps(
-                {
-                    "template_id": "cd987859-06fe-4b1a-9e96-47d4f36bf819",
-                    "report_id": "3d1bfbab-d9ec-46c7-aa8e-9c1d1808f2b8",
-                    "report_trigger": "single",
-                    "created_at": "2020-09-24T19:07:59.311462",
-                    "created_by": "adora@example.com",
-                },
-                indent=4,
-                sort_keys=True,
-            ),
+            "find_return": ADORA_TEMPLATE_REPORT_MAP_JSON,
             "email": "catra@example.com",
-            "return": json.dumps(
-                {"message": "Successfully deleted 1 row"}, indent=4, sort_keys=True
-            ),
+            "return": DELETED_JSON,
             "interactive": {
                 "input": "y",
-                "message": "Mapping for template with id cd987859-06fe-4b1a-9e96-47d4f36bf819 and "
-                "report with id 3d1bfbab-d9ec-46c7-aa8e-9c1d1808f2b8 triggered by single was created by "
+                "message": f"Mapping for template with id {TEMPLATE_ID} and "
+                f"report with id {REPORT_ID} triggered by single was created by "
                 "adora@example.com. Are you sure you want to delete? [y/N]: y\n",
             },
         },
@@ -3629,32 +2483,22 @@ def test_find_report_maps(find_report_maps_data):
             "args": [
                 "template",
                 "delete_report_map_by_id",
-                "cd987859-06fe-4b1a-9e96-47d4f36bf819",
-                "3d1bfbab-d9ec-46c7-aa8e-9c1d1808f2b8",
+                TEMPLATE_ID,
+                REPORT_ID,
                 "single"
             ],
             "params": [
-                "cd987859-06fe-4b1a-9e96-47d4f36bf819",
-                "3d1bfbab-d9ec-46c7-aa8e-9c1d1808f2b8",
+                TEMPLATE_ID,
+                REPORT_ID,
                 "single"
             ],
-            "find_return": json.dumps(
-                {
-                    "template_id": "cd987859-06fe-4b1a-9e96-47d4f36bf819",
-                    "report_id": "3d1bfbab-d9ec-46c7-aa8e-9c1d1808f2b8",
-                    "report_trigger": "single",
-                    "created_at": "2020-09-24T19:07:59.311462",
-                    "created_by": "adora@example.com",
-                },
-                indent=4,
-                sort_keys=True,
-            ),
+            "find_return": ADORA_TEMPLATE_REPORT_MAP_JSON,
             "email": "catra@example.com",
             "return": "",
             "interactive": {
                 "input": "n",
-                "message": "Mapping for template with id cd987859-06fe-4b1a-9e96-47d4f36bf819 and "
-                "report with id 3d1bfbab-d9ec-46c7-aa8e-9c1d1808f2b8 triggered by single was created by "
+                "message": f"Mapping for template with id {TEMPLATE_ID} and "
+                f"report with id {REPORT_ID} triggered by single was created by "
                "adora@example.com. Are you sure you want to delete? [y/N]: n",
             },
             "logging": "Okay, aborting delete operation",
@@ -3669,43 +2513,16 @@ def test_find_report_maps(find_report_maps_data):
             "\n"
             "Error: Missing argument 'TEMPLATE'.",
         },
-    ]
+    ],
+    ids=["by_id", "by_name", "yes_flag", "confirmed", "aborted", "missing_args"],
 )
 def delete_report_map_by_id_data(request):
-    # We want to load the value from "email" from config
-    mockito.when(config).load_var("email").thenReturn(request.param["email"])
-    # Set all requests to return None so only the one we expect will return a value
-    mockito.when(template_reports).delete_map_by_ids(...).thenReturn(None)
-    mockito.when(template_reports).find_map_by_ids(...).thenReturn(None)
-    # If there's a value for from_name, set the return value for trying to retrieve the existing
-    # record
-    if "from_names" in request.param:
-        mockito.when(reports).find(
-            name=request.param["from_names"]["report_name"],
-            limit=2
-        ).thenReturn(request.param["from_names"]["report_return"])
-        mockito.when(templates).find(
-            name=request.param["from_names"]["template_name"],
-            limit=2
-        ).thenReturn(request.param["from_names"]["template_return"])
-    # Mock up request response only if we expect it to get that far
-    if len(request.param["params"]) > 0:
-        mockito.when(template_reports).delete_map_by_ids(
-            request.param["params"][0],
-            request.param["params"][1],
-            request.param["params"][2],
-        ).thenReturn(request.param["return"])
-        mockito.when(template_reports).find_map_by_ids(
-            request.param["params"][0],
-            request.param["params"][1],
-            request.param["params"][2],
-        ).thenReturn(request.param["find_return"])
+    stub_map_delete(template_reports, reports, "report_from_name", request.param)
     return request.param
 
 
-def test_delete_report_map_by_id(delete_report_map_by_id_data, caplog):
+def test_delete_report_map_by_id(delete_report_map_by_id_data, runner, caplog):
     caplog.set_level(logging.INFO)
-    runner = CliRunner()
     # Include interactive input and expected message if this test should trigger interactive stuff
     if "interactive" in delete_report_map_by_id_data:
         expected_output = (